@@ -12,7 +12,7 @@ python gui.py
 import sys
 import random
 import tempfile
-from time import sleep
+from time import sleep, monotonic
 import pyqtgraph as pg
 
 import logging
@@ -40,6 +40,8 @@ class TestProcedure(Procedure):
 
     def execute(self):
         log.info("Starting to generate numbers")
+        start = monotonic()
+        percent = None
         for i in range(self.iterations):
             data = {
                 'Iteration': i,
@@ -47,8 +49,14 @@ class TestProcedure(Procedure):
             }
             log.debug("Produced numbers: %s" % data)
             self.emit('results', data)
-            self.emit('progress', 100*i/self.iterations)
-            sleep(self.delay)
+            # Only report progress when the whole percentage changes
+            if 100*i//self.iterations != percent:
+                percent = 100*i//self.iterations
+                self.emit('progress', 100*i/self.iterations)
+            # Sleep until the next point is due, so that delays do not drift
+            remaining = start + (i + 1)*self.delay - monotonic()
+            if remaining > 0:
+                sleep(remaining)
             if self.should_stop():
                 log.warning("Catch stop command in procedure")
                 break
@@ -11,7 +11,7 @@ python script_plotter.py
 
 import random
 import tempfile
-from time import sleep
+from time import sleep, monotonic
 
 import logging
 log = logging.getLogger(__name__)
@@ -37,6 +37,8 @@ class TestProcedure(Procedure):
 
     def execute(self):
         log.info("Starting to generate numbers")
+        start = monotonic()
+        percent = None
         for i in range(self.iterations):
             data = {
                 'Iteration': i,
@@ -44,8 +46,14 @@ class TestProcedure(Procedure):
             }
             log.debug("Produced numbers: %s" % data)
             self.emit('results', data)
-            self.emit('progress', 100.*i/self.iterations)
-            sleep(self.delay)
+            # Only report progress when the whole percentage changes
+            if 100*i//self.iterations != percent:
+                percent = 100*i//self.iterations
+                self.emit('progress', 100.*i/self.iterations)
+            # Sleep until the next point is due, so that delays do not drift
+            remaining = start + (i + 1)*self.delay - monotonic()
+            if remaining > 0:
+                sleep(remaining)
             if self.should_stop():
                 log.warning("Catch stop command in procedure")
                 break
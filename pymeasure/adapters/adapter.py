@@ -84,14 +84,21 @@ class Adapter(object):
         elif callable(self.preprocess_reply):
             results = self.preprocess_reply(results)
         results = results.split(separator)
+        if cast == bool:
+            # Need to cast to float first since results are usually
+            # strings and bool of a non-empty string is always True
+            def convert(result):
+                return bool(float(result))
+        else:
+            convert = cast
+        try:
+            # Cast all values in one pass, which succeeds for most replies
+            return list(map(convert, results))
+        except Exception:
+            pass
         for i, result in enumerate(results):
             try:
-                if cast == bool:
-                    # Need to cast to float first since results are usually
-                    # strings and bool of a non-empty string is always True
-                    results[i] = bool(float(result))
-                else:
-                    results[i] = cast(result)
+                results[i] = convert(result)
             except Exception:
                 pass  # Keep as string
         return results
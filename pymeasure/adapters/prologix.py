@@ -98,18 +98,23 @@ class PrologixAdapter(SerialAdapter):
         :param command: SCPI command string to be sent to the instrument
         """
         if self.address is not None:
-            address_command = "++addr %d\n" % self.address
-            self.connection.write(address_command.encode())
+            # The address is sent with every command, since the connection
+            # may be shared with adapters for other addresses (see gpib),
+            # but both go out in a single serial write
+            command = "++addr %d\n%s" % (self.address, command)
         command += "\n"
         self.connection.write(command.encode())
 
     def read(self):
-        """ Reads the response of the instrument until timeout
+        """ Reads the response of the instrument until timeout. The
+        controller does not pass on the end of the response (EOI), and
+        responses can span several lines, so all bytes are read that arrive
+        before the serial timeout, unless a read_termination is set.
 
         :returns: String ASCII response of the instrument
         """
         self.write("++read eoi")
-        return b"\n".join(self.connection.readlines()).decode()
+        return super().read()
 
     def gpib(self, address, rw_delay=None):
         """ Returns and PrologixAdapter object that references the GPIB
@@ -40,11 +40,14 @@ class SerialAdapter(Adapter):
     :param port: Serial port
     :param preprocess_reply: optional callable used to preprocess strings
         received from the instrument. The callable returns the processed string.
+    :param read_termination: optional string which ends each response, so
+        that it is returned without waiting for the serial timeout
     :param kwargs: Any valid key-word argument for serial.Serial
     """
 
-    def __init__(self, port, preprocess_reply=None, **kwargs):
+    def __init__(self, port, preprocess_reply=None, read_termination=None, **kwargs):
         super().__init__(preprocess_reply=preprocess_reply)
+        self.read_termination = read_termination
         if isinstance(port, serial.Serial):
             self.connection = port
         else:
@@ -63,12 +66,25 @@ class SerialAdapter(Adapter):
         self.connection.write(command.encode())  # encode added for Python 3
 
     def read(self):
-        """ Reads until the buffer is empty and returns the resulting
-        ASCII respone
+        """ Reads until the connection times out, or until the
+        :attr:`read_termination` ends the response if one is set, and
+        returns the resulting ASCII response. All bytes already waiting are
+        fetched with each read call.
 
         :returns: String ASCII response of the instrument.
         """
-        return b"\n".join(self.connection.readlines()).decode()
+        termination = None
+        if self.read_termination:
+            termination = self.read_termination.encode()
+        response = bytearray()
+        while True:
+            chunk = self.connection.read(max(1, self.connection.in_waiting))
+            if not chunk:
+                break  # Timed out without further data
+            response.extend(chunk)
+            if termination is not None and response.endswith(termination):
+                break
+        return response.decode()
 
     def binary_values(self, command, header_bytes=0, dtype=np.float32):
         """ Returns a numpy array from a query for binary data 
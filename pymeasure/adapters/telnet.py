@@ -22,12 +22,41 @@
 # THE SOFTWARE.
 #
 
+import socket
 import telnetlib
 import time
 
 from .adapter import Adapter
 
 
+class _Telnet(telnetlib.Telnet):
+    """ Telnet connection, which moves received data without any telnet
+    commands to the cooked queue at once, rather than byte by byte.
+    """
+
+    def fill_rawq(self):
+        if self.irawq >= len(self.rawq):
+            self.rawq = b''
+            self.irawq = 0
+        # a larger buffer than in telnetlib, since process_rawq does not
+        # process most replies byte by byte
+        buf = self.sock.recv(4096)
+        self.msg("recv %r", buf)
+        self.eof = (not buf)
+        self.rawq = self.rawq + buf
+
+    def process_rawq(self):
+        if not self.iacseq and not self.sb:
+            data = self.rawq[self.irawq:]
+            if (telnetlib.IAC not in data and telnetlib.theNULL not in data
+                    and b"\021" not in data):
+                self.cookedq = self.cookedq + data
+                self.rawq = b''
+                self.irawq = 0
+                return
+        super().process_rawq()
+
+
 class TelnetAdapter(Adapter):
     """ Adapter class for using the Python telnetlib package to allow
     communication to instruments
@@ -52,7 +81,10 @@ class TelnetAdapter(Adapter):
                 raise TypeError(
                     f"TelnetAdapter: unexpected keyword argument '{kw}', "
                     f"allowed are: {str(safe_keywords)}")
-        self.connection = telnetlib.Telnet(host, port, **kwargs)
+        self.connection = _Telnet(host, port, **kwargs)
+        # commands are short and each waits for a reply, which Nagle's
+        # algorithm would delay
+        self.connection.sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
 
     def __del__(self):
         """ Ensures the connection is closed upon deletion
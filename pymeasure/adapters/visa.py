@@ -24,7 +24,6 @@
 
 import logging
 
-import copy
 import pyvisa
 import numpy as np
 from pkg_resources import parse_version
@@ -48,6 +47,12 @@ class VISAAdapter(Adapter):
     :param kwargs: Any valid key-word arguments for constructing a PyVISA instrument
     """
 
+    #: Key-word arguments that are passed on to the PyVISA instrument
+    SAFE_KEYWORDS = frozenset((
+        'resource_name', 'timeout', 'chunk_size', 'lock', 'query_delay',
+        'send_end', 'values_format', 'read_termination', 'write_termination'
+    ))
+
     def __init__(self, resourceName, visa_library='', preprocess_reply=None, **kwargs):
         super().__init__(preprocess_reply=preprocess_reply)
         if not VISAAdapter.has_supported_version():
@@ -57,13 +62,8 @@ class VISAAdapter(Adapter):
             resourceName = "GPIB0::%d::INSTR" % resourceName
         self.resource_name = resourceName
         self.manager = pyvisa.ResourceManager(visa_library)
-        safeKeywords = ['resource_name', 'timeout',
-                        'chunk_size', 'lock', 'query_delay', 'send_end',
-                        'values_format', 'read_termination', 'write_termination']
-        kwargsCopy = copy.deepcopy(kwargs)
-        for key in kwargsCopy:
-            if key not in safeKeywords:
-                kwargs.pop(key)
+        kwargs = {key: value for key, value in kwargs.items()
+                  if key in self.SAFE_KEYWORDS}
         self.connection = self.manager.open_resource(
             resourceName,
             **kwargs
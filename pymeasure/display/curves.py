@@ -45,7 +45,8 @@ class ResultsCurve(pg.PlotDataItem):
     """ Creates a curve loaded dynamically from a file through the Results
     object and supports error bars. The data can be forced to fully reload
     on each update, useful for cases when the data is changing across the full
-    file instead of just appending.
+    file instead of just appending. Otherwise, the curve is only redrawn when
+    rows were appended or the axes were changed since the last update.
     """
 
     def __init__(self, results, x, y, xerr=None, yerr=None,
@@ -55,6 +56,7 @@ class ResultsCurve(pg.PlotDataItem):
         self.pen = kwargs.get('pen', None)
         self.x, self.y = x, y
         self.force_reload = force_reload
+        self._plotted = None  # Length and axes of the data last plotted
         if xerr or yerr:
             self._errorBars = pg.ErrorBarItem(pen=kwargs.get('pen', None))
             self.xerr, self.yerr = xerr, yerr
@@ -65,6 +67,12 @@ class ResultsCurve(pg.PlotDataItem):
             self.results.reload()
         data = self.results.data  # get the current snapshot
 
+        # Skip redrawing appended data when nothing was appended
+        plotted = (len(data), self.x, self.y)
+        if not self.force_reload and plotted == self._plotted:
+            return
+        self._plotted = plotted
+
         # Set x-y data
         self.setData(data[self.x], data[self.y])
 
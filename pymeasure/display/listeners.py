@@ -23,9 +23,12 @@
 #
 
 import logging
+from queue import Empty
+from time import monotonic
 
 from .Qt import QtCore
 from .thread import StoppableQThread
+from ..experiment.listeners import INPROC_ADDRESS
 from ..experiment.procedure import Procedure
 
 log = logging.getLogger(__name__)
@@ -46,36 +49,63 @@ class QListener(StoppableQThread):
     method call
     """
 
-    def __init__(self, port, topic='', timeout=0.01):
+    def __init__(self, port, topic='', timeout=0.01, inproc=False):
         """ Constructs the Listener object with a subscriber port
         over which to listen for messages
 
         :param port: TCP port to listen on
         :param topic: Topic to listen on
         :param timeout: Timeout in seconds to recheck stop flag
+        :param inproc: Listen on the in-process endpoint of the Worker
+                       publishing on the port, which bypasses the TCP
+                       stack, if the Worker runs in the same process
         """
         super().__init__()
 
         self.port = port
         self.topic = topic
-        self.context = zmq.Context()
+        self.context = zmq.Context.instance()
         log.debug("%s has ZMQ Context: %r" % (self.__class__.__name__, self.context))
         self.subscriber = self.context.socket(zmq.SUB)
-        self.subscriber.connect('tcp://localhost:%d' % port)
+        if inproc:
+            address = INPROC_ADDRESS % port
+        else:
+            address = 'tcp://localhost:%d' % port
+        self.subscriber.connect(address)
         self.subscriber.setsockopt(zmq.SUBSCRIBE, topic.encode())
-        log.info("%s connected to '%s' topic on tcp://localhost:%d" % (
-            self.__class__.__name__, topic, port))
+        log.info("%s connected to '%s' topic on %s" % (
+            self.__class__.__name__, topic, address))
 
         self.poller = zmq.Poller()
         self.poller.register(self.subscriber, zmq.POLLIN)
         self.timeout = timeout
 
     def receive(self, flags=0):
-        topic, record = self.subscriber.recv_serialized(deserialize=cloudpickle.loads, flags=flags)
-        return topic, record
+        # Receive frames without copying, so the record is unpickled
+        # straight from the message buffer
+        topic, record, *buffers = self.subscriber.recv_multipart(flags=flags, copy=False)
+        if buffers:  # Out-of-band buffers of the arrays in the record
+            return topic.bytes.decode(), cloudpickle.loads(
+                record.buffer, buffers=[buffer.buffer for buffer in buffers])
+        return topic.bytes.decode(), cloudpickle.loads(record.buffer)
+
+    def receive_all(self):
+        """ Waits up to the timeout for a message to arrive and returns
+        all messages queued on the subscriber as a list of (topic, record)
+        tuples, so that bursts are drained in one wakeup
+        """
+        messages = []
+        if self.message_waiting():
+            while True:
+                try:
+                    messages.append(self.receive(flags=zmq.NOBLOCK))
+                except zmq.Again:
+                    break
+        return messages
 
     def message_waiting(self):
-        return self.poller.poll(self.timeout)
+        # The poller expects the timeout in milliseconds
+        return self.poller.poll(self.timeout * 1000)
 
     def __repr__(self):
         return "<%s(port=%s,topic=%s,should_stop=%s)>" % (
@@ -86,8 +116,15 @@ class Monitor(QtCore.QThread):
     """ Monitor listens for status and progress messages
     from a Worker through a queue to ensure no messages
     are losts
+
+    Progress updates are emitted at most once per :attr:`progress_interval`
+    seconds, keeping only the latest value, so that fast procedures do not
+    flood the GUI thread. Status changes are always emitted immediately.
     """
 
+    #: Minimum time in seconds between two emitted progress signals
+    progress_interval = 1 / 30.
+
     status = QtCore.QSignal(int)
     progress = QtCore.QSignal(float)
     log = QtCore.QSignal(object)
@@ -99,26 +136,59 @@ class Monitor(QtCore.QThread):
     def __init__(self, queue):
         super().__init__()
         self.queue = queue
+        # Look up the handler of each topic and the signal of each status
+        # by key, instead of comparing against every topic in turn
+        self._topic_handlers = {
+            'status': self._handle_status,
+            'progress': self._handle_progress,
+            'log': self.log.emit,
+        }
+        self._last_progress = None
+        self._pending_progress = None
+        self._status_signals = {
+            Procedure.RUNNING: self.worker_running,
+            Procedure.FAILED: self.worker_failed,
+            Procedure.FINISHED: self.worker_finished,
+            Procedure.ABORTED: self.worker_abort_returned,
+        }
+
+    def _handle_progress(self, progress):
+        now = monotonic()
+        if (self._last_progress is None or
+                now - self._last_progress >= self.progress_interval):
+            self.progress.emit(progress)
+            self._last_progress = now
+            self._pending_progress = None
+        else:
+            self._pending_progress = progress
+
+    def _flush_progress(self):
+        if self._pending_progress is not None:
+            self.progress.emit(self._pending_progress)
+            self._last_progress = monotonic()
+            self._pending_progress = None
+
+    def _handle_status(self, status):
+        self._flush_progress()
+        self.status.emit(status)
+        signal = self._status_signals.get(status)
+        if signal is not None:
+            signal.emit()
 
     def run(self):
         while True:
-            data = self.queue.get()
+            try:
+                data = self.queue.get(timeout=self.progress_interval)
+            except Empty:
+                # Emit a held back progress value once the worker is idle
+                self._flush_progress()
+                continue
             if data is None:
+                self._flush_progress()
                 break
             topic, data = data
-            if topic == 'status':
-                self.status.emit(data)
-                if data == Procedure.RUNNING:
-                    self.worker_running.emit()
-                elif data == Procedure.FAILED:
-                    self.worker_failed.emit()
-                elif data == Procedure.FINISHED:
-                    self.worker_finished.emit()
-                elif data == Procedure.ABORTED:
-                    self.worker_abort_returned.emit()
-            elif topic == 'progress':
-                self.progress.emit(data)
-            elif topic == 'log':
-                self.log.emit(data)
+            handler = self._topic_handlers.get(topic)
+            if handler is not None:
+                handler(data)
 
         log.info("Monitor caught stop command")
@@ -43,6 +43,9 @@ from ..experiment.results import Results
 log = logging.getLogger(__name__)
 log.addHandler(logging.NullHandler())
 
+# Formats the crosshair coordinates, which are updated on each mouse movement
+_format_coordinates = "({:g}, {:g})".format
+
 
 class PlotFrame(QtGui.QFrame):
     """ Combines a PyQtGraph Plot with Crosshairs. Refreshes
@@ -85,28 +88,39 @@ class PlotFrame(QtGui.QFrame):
         self.setLayout(vbox)
 
         self.plot = self.plot_widget.getPlotItem()
+        # Long measurements are drawn with at most a few points per pixel. This
+        # is set on the plot, as it applies its mode to each curve it is given
+        self.plot.setDownsampling(auto=True, mode='peak')
 
         self.crosshairs = Crosshairs(self.plot,
                                      pen=pg.mkPen(color='#AAAAAA', style=QtCore.Qt.DashLine))
         self.crosshairs.coordinates.connect(self.update_coordinates)
+        # The crosshairs follow the mouse on their own, and only need to be
+        # updated by the plot when the view under the cursor changes
+        self.plot.sigRangeChanged.connect(lambda *args: self.crosshairs.update())
 
         self.timer = QtCore.QTimer()
         self.timer.timeout.connect(self.update_curves)
-        self.timer.timeout.connect(self.crosshairs.update)
         self.timer.timeout.connect(self.updated)
         self.timer.start(int(self.refresh_time * 1e3))
 
     def update_coordinates(self, x, y):
-        self.coordinates.setText("(%g, %g)" % (x, y))
+        self.coordinates.setText(_format_coordinates(x, y))
+
+    def _curves(self):
+        """ Returns the ResultsCurves of the plot, from the list of data items
+        that pyqtgraph keeps, rather than scanning every item of the plot
+        """
+        return [item for item in self.plot.listDataItems()
+                if isinstance(item, ResultsCurve)]
 
     def update_curves(self):
-        for item in self.plot.items:
-            if isinstance(item, ResultsCurve):
-                if self.check_status:
-                    if item.results.procedure.status == Procedure.RUNNING:
-                        item.update()
-                else:
+        for item in self._curves():
+            if self.check_status:
+                if item.results.procedure.status == Procedure.RUNNING:
                     item.update()
+            else:
+                item.update()
 
     def parse_axis(self, axis):
         """ Returns the units of an axis by searching the string
@@ -125,20 +139,18 @@ class PlotFrame(QtGui.QFrame):
             return axis, None
 
     def change_x_axis(self, axis):
-        for item in self.plot.items:
-            if isinstance(item, ResultsCurve):
-                item.x = axis
-                item.update()
+        for item in self._curves():
+            item.x = axis
+            item.update()
         label, units = self.parse_axis(axis)
         self.plot.setLabel('bottom', label, units=units, **self.LABEL_STYLE)
         self.x_axis = axis
         self.x_axis_changed.emit(axis)
 
     def change_y_axis(self, axis):
-        for item in self.plot.items:
-            if isinstance(item, ResultsCurve):
-                item.y = axis
-                item.update()
+        for item in self._curves():
+            item.y = axis
+            item.update()
         label, units = self.parse_axis(axis)
         self.plot.setLabel('left', label, units=units, **self.LABEL_STYLE)
         self.y_axis = axis
@@ -150,6 +162,8 @@ class PlotWidget(QtGui.QWidget):
     of the data to be dynamically choosen
     """
 
+    _pens = {}  # Pens of the curves, shared by color and width
+
     def __init__(self, columns, x_axis=None, y_axis=None, refresh_time=0.2, check_status=True,
                  parent=None):
         super().__init__(parent)
@@ -175,9 +189,8 @@ class PlotWidget(QtGui.QWidget):
 
         self.columns_x = QtGui.QComboBox(self)
         self.columns_y = QtGui.QComboBox(self)
-        for column in self.columns:
-            self.columns_x.addItem(column)
-            self.columns_y.addItem(column)
+        self.columns_x.addItems(self.columns)
+        self.columns_y.addItems(self.columns)
         self.columns_x.activated.connect(self.update_x_column)
         self.columns_y.activated.connect(self.update_y_column)
 
@@ -213,18 +226,31 @@ class PlotWidget(QtGui.QWidget):
 
     def new_curve(self, results, color=pg.intColor(0), **kwargs):
         if 'pen' not in kwargs:
-            kwargs['pen'] = pg.mkPen(color=color, width=2)
+            kwargs['pen'] = self.pen(color, width=2)
         if 'antialias' not in kwargs:
             kwargs['antialias'] = False
+        # Set at construction, rather than afterwards, to lay out the curve once
+        kwargs['symbol'] = kwargs['symbolBrush'] = None
         curve = ResultsCurve(results,
                              x=self.plot_frame.x_axis,
                              y=self.plot_frame.y_axis,
                              **kwargs
                              )
-        curve.setSymbol(None)
-        curve.setSymbolBrush(None)
+        # Keep the rendered line cached, so that overlays such as the
+        # crosshairs do not force it to be redrawn. The line is painted by
+        # the PlotCurveItem of the curve, not by the curve itself
+        curve.curve.setCacheMode(QtGui.QGraphicsItem.DeviceCoordinateCache)
         return curve
 
+    @classmethod
+    def pen(cls, color, width):
+        """ Returns a pen of the given color and width, which is created once
+        and shared between the curves """
+        key = (pg.mkColor(color).rgba(), width)
+        if key not in cls._pens:
+            cls._pens[key] = pg.mkPen(color=color, width=width)
+        return cls._pens[key]
+
     def update_x_column(self, index):
         axis = self.columns_x.itemText(index)
         self.plot_frame.change_x_axis(axis)
@@ -293,15 +319,17 @@ class ImageFrame(QtGui.QFrame):
         self.crosshairs = Crosshairs(self.plot,
                                      pen=pg.mkPen(color='#AAAAAA', style=QtCore.Qt.DashLine))
         self.crosshairs.coordinates.connect(self.update_coordinates)
+        # The crosshairs follow the mouse on their own, and only need to be
+        # updated by the plot when the view under the cursor changes
+        self.plot.sigRangeChanged.connect(lambda *args: self.crosshairs.update())
 
         self.timer = QtCore.QTimer()
         self.timer.timeout.connect(self.update_curves)
-        self.timer.timeout.connect(self.crosshairs.update)
         self.timer.timeout.connect(self.updated)
         self.timer.start(int(self.refresh_time * 1e3))
 
     def update_coordinates(self, x, y):
-        self.coordinates.setText("(%g, %g)" % (x, y))
+        self.coordinates.setText(_format_coordinates(x, y))
 
     def update_curves(self):
         for item in self.plot.items:
@@ -367,8 +395,7 @@ class ImageWidget(QtGui.QWidget):
         self.columns_z_label.setText('Z Axis:')
 
         self.columns_z = QtGui.QComboBox(self)
-        for column in self.columns:
-            self.columns_z.addItem(column)
+        self.columns_z.addItems(self.columns)
         self.columns_z.activated.connect(self.update_z_column)
 
         self.image_frame = ImageFrame(
@@ -540,11 +567,34 @@ class LogWidget(QtGui.QWidget):
         self.setLayout(vbox)
 
 
+class _ResultsLoader(QtCore.QThread):
+    """ Loads a data file in a separate thread, so that previewing a large
+    file does not freeze the :class:`ResultsDialog`
+    """
+    loaded = QtCore.QSignal(str, object)
+
+    def __init__(self, filename, parent=None):
+        super().__init__(parent)
+        self.filename = filename
+
+    def run(self):
+        try:
+            results = Results.load(self.filename)
+        except ValueError:
+            return
+        except Exception:
+            log.exception("Failed to load the preview of '%s'", self.filename)
+            return
+        self.loaded.emit(self.filename, results)
+
+
 class ResultsDialog(QtGui.QFileDialog):
     def __init__(self, columns, x_axis=None, y_axis=None, parent=None):
         super().__init__(parent)
         self.columns = columns
         self.x_axis, self.y_axis = x_axis, y_axis
+        self._filename = None
+        self._loaders = set()
         self.setOption(QtGui.QFileDialog.DontUseNativeDialog, True)
         self._setup_ui()
 
@@ -579,29 +629,44 @@ class ResultsDialog(QtGui.QFileDialog):
 
     def update_plot(self, filename):
         self.plot.clear()
+        self._filename = str(filename)
         if not os.path.isdir(filename) and filename != '':
-            try:
-                results = Results.load(str(filename))
-            except ValueError:
-                return
-            except Exception as e:
-                raise e
-
-            curve = ResultsCurve(results,
-                                 x=self.plot_widget.plot_frame.x_axis,
-                                 y=self.plot_widget.plot_frame.y_axis,
-                                 pen=pg.mkPen(color=(255, 0, 0), width=1.75),
-                                 antialias=True
-                                 )
-            curve.update()
-
-            self.plot.addItem(curve)
-
-            self.preview_param.clear()
-            for key, param in results.procedure.parameter_objects().items():
-                new_item = QtGui.QTreeWidgetItem([param.name, str(param)])
-                self.preview_param.addTopLevelItem(new_item)
-            self.preview_param.sortItems(0, QtCore.Qt.AscendingOrder)
+            # Parse the file in the background, see _show_results
+            loader = _ResultsLoader(self._filename, parent=self)
+            loader.loaded.connect(self._show_results)
+            loader.finished.connect(partial(self._loaders.discard, loader))
+            self._loaders.add(loader)
+            loader.start()
+
+    def _show_results(self, filename, results):
+        if filename != self._filename:
+            return  # Another file was selected while this one was loading
+
+        curve = ResultsCurve(results,
+                             x=self.plot_widget.plot_frame.x_axis,
+                             y=self.plot_widget.plot_frame.y_axis,
+                             pen=PlotWidget.pen((255, 0, 0), width=1.75),
+                             antialias=True
+                             )
+        curve.curve.setCacheMode(QtGui.QGraphicsItem.DeviceCoordinateCache)
+        curve.update()
+
+        self.plot.addItem(curve)
+
+        # Sorted by name here, so that the tree does not have to sort the items
+        parameters = sorted(results.procedure.parameter_objects().values(),
+                            key=lambda param: param.name)
+        items = [QtGui.QTreeWidgetItem([param.name, str(param)]) for param in parameters]
+        self.preview_param.setUpdatesEnabled(False)
+        self.preview_param.clear()
+        self.preview_param.addTopLevelItems(items)
+        self.preview_param.setUpdatesEnabled(True)
+
+    def done(self, result):
+        # Loaders are children of the dialog, and must finish before it goes
+        for loader in list(self._loaders):
+            loader.wait()
+        super().done(result)
 
 
 """ This defines a list of functions that can be used to generate a sequence. """
@@ -39,14 +39,15 @@ from pymeasure.experiment import Results, Worker
 from .parameters import Measurable
 import time, signal
 import numpy as np
+import pandas as pd
 import tempfile
-import gc
 
 
 def get_array(start, stop, step):
     """Returns a numpy array from start to stop"""
-    step = np.sign(stop - start) * abs(step)
-    return np.arange(start, stop + step, step)
+    step = abs(step) if stop >= start else -abs(step)
+    num = int(np.ceil((stop - start) / step)) + 1
+    return np.linspace(start, start + (num - 1) * step, num)
 
 
 def get_array_steps(start, stop, numsteps):
@@ -56,8 +57,25 @@ def get_array_steps(start, stop, numsteps):
 
 def get_array_zero(maxval, step):
     """Returns a numpy array from 0 to maxval to -maxval to 0"""
-    return np.concatenate((np.arange(0, maxval, step), np.arange(maxval, -maxval, -step),
-                           np.arange(-maxval, 0, step)))
+    n1 = max(int(np.ceil(maxval / step)), 0)
+    n2 = max(int(np.ceil(2 * maxval / step)), 0)
+    # Fill a single array of indices in place, segment by segment
+    out = np.arange(2 * n1 + n2, dtype=np.float64)
+    up, down, back = out[:n1], out[n1:n1 + n2], out[n1 + n2:]
+    up *= step
+    down -= n1
+    down *= -step
+    down += maxval
+    back -= n1 + n2
+    back *= step
+    back -= maxval
+    return out
+
+
+def _unanalysed(data):
+    """Default analyse function of an :class:`Experiment`, which returns the
+    data as it is"""
+    return data
 
 
 def create_filename(title):
@@ -98,11 +116,18 @@ class Experiment(object):
     :param procedure: The procedure object
     :param analyse: Post-analysis function, which takes a pandas dataframe as input and
         returns it with added (analysed) columns. The analysed results are accessible via
-        experiment.data, as opposed to experiment.results.data for the 'raw' data.
+        experiment.data, as opposed to experiment.results.data for the 'raw' data. The
+        dataframe shares its columns with the raw data, which should therefore not be
+        modified in place.
     :param _data_timeout: Time limit for how long live plotting should wait for datapoints.
     """
 
-    def __init__(self, title, procedure, analyse=(lambda x: x)):
+    #: Time in seconds between redraws of the live plots
+    refresh_interval = 0.1
+    #: Number of live plot updates between rescaling the axes to the data
+    autoscale_interval = 10
+
+    def __init__(self, title, procedure, analyse=_unanalysed):
         self.title = title
         self.procedure = procedure
         self.measlist = []
@@ -110,6 +135,9 @@ class Experiment(object):
         self.plots = []
         self.figs = []
         self._data = []
+        self._data_len = None  # Number of raw rows behind the analysed data
+        self._pcolor_grids = {}
+        self._plot_updates = 0
         self.analyse = analyse
         self._data_timeout = 10
 
@@ -138,18 +166,29 @@ class Experiment(object):
     @property
     def data(self):
         """Data property which returns analysed data, if an analyse function
-        is defined, otherwise returns the raw data."""
-        self._data = self.analyse(self.results.data.copy())
+        is defined, otherwise returns the raw data. The analysis is only
+        repeated when new rows have been recorded."""
+        data = self.results.data
+        if len(data) != self._data_len:
+            if self.analyse is _unanalysed:
+                self._data = data
+            else:
+                # Added columns do not reach the raw data, without copying it
+                self._data = self.analyse(data.copy(deep=False))
+            self._data_len = len(data)
         return self._data
 
     def wait_for_data(self):
         """Wait for the data attribute to fill with datapoints."""
-        t = time.time()
+        deadline = time.monotonic() + self._data_timeout
         while self.data.empty:
-            time.sleep(.1)
-            if (time.time() - t) > self._data_timeout:
+            if time.monotonic() > deadline:
                 log.warning('Timeout, no data received for liveplot')
                 return False
+            # Wakes up immediately if the worker finishes in the meantime
+            if self.worker.wait_for_stop(self.refresh_interval) and self.data.empty:
+                log.warning('Worker stopped, no data received for liveplot')
+                return False
         return True
 
     def plot_live(self, *args, **kwargs):
@@ -160,7 +199,8 @@ class Experiment(object):
             if not (self.plots):
                 self.plot(*args, **kwargs)
             while not self.worker.should_stop():
-                self.update_plot()
+                self.update_plot(delay=0)
+                self.worker.wait_for_stop(self.refresh_interval)
             display.clear_output(wait=True)
             if self.worker.is_alive():
                 self.worker.terminate()
@@ -184,14 +224,15 @@ class Experiment(object):
             pl.close()
         self.figs = []
         self.plots = []
-        gc.collect()
 
-    def update_plot(self):
+    def update_plot(self, delay=0.1):
         """Update the plots in the plots list with new data from the experiment.data
-        pandas dataframe."""
+        pandas dataframe, and then sleep for the delay in seconds."""
         try:
             tasks = []
             self.data
+            autoscale = self._plot_updates % self.autoscale_interval == 0
+            self._plot_updates += 1
             for plot in self.plots:
                 ax = plot['ax']
                 if plot['type'] == 'plot':
@@ -199,14 +240,14 @@ class Experiment(object):
                     if type(y) == str:
                         y = [y]
                     for yname, line in zip(y, ax.lines):
-                        self.update_line(ax, line, x, yname)
+                        self.update_line(ax, line, x, yname, autoscale)
                 if plot['type'] == 'pcolor':
                     x, y, z = plot['x'], plot['y'], plot['z']
-                    update_pcolor(ax, x, y, z)
+                    self.update_pcolor(ax, x, y, z)
 
             display.clear_output(wait=True)
             display.display(*self.figs)
-            time.sleep(0.1)
+            time.sleep(delay)
         except KeyboardInterrupt:
             display.clear_output(wait=True)
             display.display(*self.figs)
@@ -216,12 +257,8 @@ class Experiment(object):
         """Plot the results from the experiment.data pandas dataframe in a pcolor graph.
         Store the plots in a plots list attribute."""
         title = self.title
-        x, y, z = self._data[xname], self._data[yname], self._data[zname]
-        shape = (len(y.unique()), len(x.unique()))
-        diff = shape[0] * shape[1] - len(z)
-        Z = np.concatenate((z.values, np.zeros(diff))).reshape(shape)
-        df = pd.DataFrame(Z, index=y.unique(), columns=x.unique())
-        ax = sns.heatmap(df)
+        Z, x_uniq, y_uniq = self._build_pcolor_grid(xname, yname, zname)
+        ax = sns.heatmap(Z, xticklabels=x_uniq, yticklabels=y_uniq)
         pl.title(title)
         pl.xlabel(xname)
         pl.ylabel(yname)
@@ -235,25 +272,35 @@ class Experiment(object):
 
     def update_pcolor(self, ax, xname, yname, zname):
         """Update a pcolor graph with new data."""
-        x, y, z = self._data[xname], self._data[yname], self._data[zname]
-        shape = (len(y.unique()), len(x.unique()))
-        diff = shape[0] * shape[1] - len(z)
-        Z = np.concatenate((z.values, np.zeros(diff))).reshape(shape)
-        df = pd.DataFrame(Z, index=y.unique(), columns=x.unique())
+        Z, x_uniq, y_uniq = self._build_pcolor_grid(xname, yname, zname)
         cbar_ax = ax.get_figure().axes[1]
-        sns.heatmap(df, ax=ax, cbar_ax=cbar_ax)
+        sns.heatmap(Z, xticklabels=x_uniq, yticklabels=y_uniq, ax=ax, cbar_ax=cbar_ax)
         ax.set_xlabel(xname)
         ax.set_ylabel(yname)
         ax.invert_yaxis()
 
-    def update_line(self, ax, hl, xname, yname):
-        """Update a line in a matplotlib graph with new data."""
-        del hl._xorig, hl._yorig
-        hl.set_xdata(self._data[xname])
-        hl.set_ydata(self._data[yname])
-        ax.relim()
-        ax.autoscale()
-        gc.collect()
+    def _build_pcolor_grid(self, xname, yname, zname):
+        """Returns the z values filled row by row into a grid of the unique y and
+        x values, padded with zeros, along with those unique values. The grid
+        of each plot is reused while its shape does not change."""
+        x, y, z = self._data[xname], self._data[yname], self._data[zname]
+        x_uniq, y_uniq = pd.unique(x.values), pd.unique(y.values)
+        shape = (len(y_uniq), len(x_uniq))
+        Z = self._pcolor_grids.get((xname, yname, zname))
+        if Z is None or Z.shape != shape:
+            Z = self._pcolor_grids[(xname, yname, zname)] = np.zeros(shape)
+        else:
+            Z.flat[len(z):] = 0
+        Z.flat[:len(z)] = z.values
+        return Z, x_uniq, y_uniq
+
+    def update_line(self, ax, hl, xname, yname, autoscale=True):
+        """Update a line in a matplotlib graph with new data, and rescale the
+        axes to the data if autoscale is True."""
+        hl.set_data(self._data[xname], self._data[yname])
+        if autoscale:
+            ax.relim()
+            ax.autoscale()
 
     def __del__(self):
         self.scribe.stop()
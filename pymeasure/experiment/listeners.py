@@ -39,6 +39,9 @@ except ImportError:
     cloudpickle = None
     log.warning("ZMQ and cloudpickle are required for TCP communication")
 
+#: Address of the in-process endpoint that a Worker publishes on next to its TCP port
+INPROC_ADDRESS = 'inproc://pymeasure-%d'
+
 
 class Monitor(QueueListener):
     def __init__(self, results, queue):
@@ -53,36 +56,63 @@ class Listener(StoppableThread):
     a ZMQ TCP port and can be stopped by a thread-safe method call
     """
 
-    def __init__(self, port, topic='', timeout=0.01):
+    def __init__(self, port, topic='', timeout=0.01, inproc=False):
         """ Constructs the Listener object with a subscriber port
         over which to listen for messages
 
         :param port: TCP port to listen on
         :param topic: Topic to listen on
         :param timeout: Timeout in seconds to recheck stop flag
+        :param inproc: Listen on the in-process endpoint of the Worker
+                       publishing on the port, which bypasses the TCP
+                       stack, if the Worker runs in the same process
         """
         super().__init__()
 
         self.port = port
         self.topic = topic
-        self.context = zmq.Context()
+        self.context = zmq.Context.instance()
         log.debug("%s has ZMQ Context: %r" % (self.__class__.__name__, self.context))
         self.subscriber = self.context.socket(zmq.SUB)
-        self.subscriber.connect('tcp://localhost:%d' % port)
+        if inproc:
+            address = INPROC_ADDRESS % port
+        else:
+            address = 'tcp://localhost:%d' % port
+        self.subscriber.connect(address)
         self.subscriber.setsockopt(zmq.SUBSCRIBE, topic.encode())
-        log.info("%s connected to '%s' topic on tcp://localhost:%d" % (
-            self.__class__.__name__, topic, port))
+        log.info("%s connected to '%s' topic on %s" % (
+            self.__class__.__name__, topic, address))
 
         self.poller = zmq.Poller()
         self.poller.register(self.subscriber, zmq.POLLIN)
         self.timeout = timeout
 
     def receive(self, flags=0):
-        topic, record = self.subscriber.recv_serialized(deserialize=cloudpickle.loads, flags=flags)
-        return topic, record
+        # Receive frames without copying, so the record is unpickled
+        # straight from the message buffer
+        topic, record, *buffers = self.subscriber.recv_multipart(flags=flags, copy=False)
+        if buffers:  # Out-of-band buffers of the arrays in the record
+            return topic.bytes.decode(), cloudpickle.loads(
+                record.buffer, buffers=[buffer.buffer for buffer in buffers])
+        return topic.bytes.decode(), cloudpickle.loads(record.buffer)
+
+    def receive_all(self):
+        """ Waits up to the timeout for a message to arrive and returns
+        all messages queued on the subscriber as a list of (topic, record)
+        tuples, so that bursts are drained in one wakeup
+        """
+        messages = []
+        if self.message_waiting():
+            while True:
+                try:
+                    messages.append(self.receive(flags=zmq.NOBLOCK))
+                except zmq.Again:
+                    break
+        return messages
 
     def message_waiting(self):
-        return self.poller.poll(self.timeout)
+        # The poller expects the timeout in milliseconds
+        return self.poller.poll(self.timeout * 1000)
 
     def __repr__(self):
         return "<%s(port=%s,topic=%s,should_stop=%s)>" % (
@@ -108,6 +138,26 @@ class Recorder(QueueListener):
 
         super().__init__(queue, *handlers)
 
+    def handle(self, record):
+        """ Writes a record of results to the data files, or a list of
+        records, which are written to each file at once
+        """
+        if not isinstance(record, list):
+            return super().handle(record)
+        if not record:
+            return
+        for handler in self.handlers:
+            rows = [handler.format(row) for row in record]
+            rows.append('')  # Terminates the last row
+            handler.acquire()
+            try:
+                if handler.stream is None:  # Opening was delayed
+                    handler.stream = handler._open()
+                handler.stream.write(handler.terminator.join(rows))
+                handler.flush()
+            finally:
+                handler.release()
+
     def stop(self):
         for handler in self.handlers:
             handler.close()
@@ -103,14 +103,26 @@ class Procedure(object):
         """
         if not self._parameters:
             self._parameters = {}
-        for item in dir(self):
-            parameter = getattr(self, item)
-            if isinstance(parameter, Parameter):
-                self._parameters[item] = deepcopy(parameter)
-                if parameter.is_set():
-                    setattr(self, item, parameter.value)
-                else:
-                    setattr(self, item, None)
+        cls = type(self)
+        for item in cls._parameter_names():
+            parameter = getattr(cls, item)
+            self._parameters[item] = deepcopy(parameter)
+            if parameter.is_set():
+                setattr(self, item, parameter.value)
+            else:
+                setattr(self, item, None)
+
+    @classmethod
+    def _parameter_names(cls):
+        """ Returns the names of the Parameter attributes of the class,
+        which are looked up once per class and then cached
+        """
+        names = cls.__dict__.get('_parameter_names_cache')
+        if names is None:
+            names = tuple(item for item in dir(cls)
+                          if isinstance(getattr(cls, item), Parameter))
+            cls._parameter_names_cache = names
+        return names
 
     def parameters_are_set(self):
         """ Returns True if all parameters are set """
@@ -138,12 +150,13 @@ class Procedure(object):
         result = {}
         for name, parameter in self._parameters.items():
             value = getattr(self, name)
-            if value is not None:
+            if value is None:
+                result[name] = None
+                continue
+            if not (parameter.is_set() and value is parameter.value):
                 parameter.value = value
                 setattr(self, name, parameter.value)
-                result[name] = parameter.value
-            else:
-                result[name] = None
+            result[name] = parameter.value
         return result
 
     def parameter_objects(self):
@@ -153,7 +166,8 @@ class Procedure(object):
         result = {}
         for name, parameter in self._parameters.items():
             value = getattr(self, name)
-            if value is not None:
+            if value is not None and not (
+                    parameter.is_set() and value is parameter.value):
                 parameter.value = value
                 setattr(self, name, parameter.value)
             result[name] = parameter
@@ -172,14 +186,17 @@ class Procedure(object):
         """ Sets a dictionary of parameters and raises an exception if additional
         parameters are present if except_missing is True
         """
+        own_parameters = self._parameters
+        if except_missing:
+            missing = parameters.keys() - own_parameters.keys()
+            if missing:
+                raise NameError("Parameter '%s' does not belong to '%s'" % (
+                    sorted(missing)[0], repr(self)))
         for name, value in parameters.items():
-            if name in self._parameters:
-                self._parameters[name].value = value
-                setattr(self, name, self._parameters[name].value)
-            else:
-                if except_missing:
-                    raise NameError("Parameter '%s' does not belong to '%s'" % (
-                        name, repr(self)))
+            parameter = own_parameters.get(name)
+            if parameter is not None:
+                parameter.value = value
+                setattr(self, name, parameter.value)
 
     def startup(self):
         """ Executes the commands needed at the start-up of the measurement
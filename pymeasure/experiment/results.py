@@ -128,6 +128,7 @@ class Results(object):
 
         self.data_filename = data_filename
         self.data_filenames = data_filenames
+        self._data_size = None  # Size of the data file when last read
 
         if os.path.exists(data_filename):  # Assume header is already written
             self.reload()
@@ -314,6 +315,10 @@ class Results(object):
                 # Empty dataframe
                 self._data = pd.DataFrame(columns=self.procedure.DATA_COLUMNS)
         else:  # Concatenate additional data, if any, to already loaded data
+            size = self._data_file_size()
+            if size is not None and size == self._data_size:
+                return self._data  # Nothing has been written since
+            self._data_size = size
             skiprows = len(self._data) + self._header_count
             chunks = pd.read_csv(
                 self.data_filename,
@@ -339,6 +344,7 @@ class Results(object):
         """ Preforms a full reloading of the file data, neglecting
         any changes in the comments
         """
+        self._data_size = self._data_file_size()
         chunks = pd.read_csv(
             self.data_filename,
             comment=Results.COMMENT,
@@ -350,6 +356,15 @@ class Results(object):
         except Exception:
             self._data = chunks.read()
 
+    def _data_file_size(self):
+        """ Returns the size of the data file, which is used to detect
+        appended data without reading the file, or None if unavailable
+        """
+        try:
+            return os.path.getsize(self.data_filename)
+        except OSError:
+            return None
+
     def __repr__(self):
         return "<{}(filename='{}',procedure={},shape={})>".format(
             self.__class__.__name__, self.data_filename,
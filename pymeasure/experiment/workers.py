@@ -24,13 +24,13 @@
 
 import sys
 import logging
-import time
+import pickle
 import traceback
 from logging.handlers import QueueHandler
 from importlib.machinery import SourceFileLoader
 from queue import Queue
 
-from .listeners import Recorder
+from .listeners import Recorder, INPROC_ADDRESS
 from .procedure import Procedure, ProcedureWrapper
 from .results import Results
 from ..log import TopicQueueHandler
@@ -48,19 +48,46 @@ except ImportError:
     log.warning("ZMQ and cloudpickle are required for TCP communication")
 
 
+def _out_of_band_pickle():
+    """ Returns True if cloudpickle can hand out buffers with protocol 5,
+    which needs Python 3.8 and cloudpickle 1.3 or later """
+    if cloudpickle is None or pickle.HIGHEST_PROTOCOL < 5:
+        return False
+    try:
+        cloudpickle.dumps(None, protocol=5, buffer_callback=[].append)
+    except TypeError:
+        return False
+    return True
+
+
+# Pickle protocol 5 hands out the buffers of numpy arrays in a record, which
+# are then sent as separate frames without being copied into the pickle
+OUT_OF_BAND_PICKLE = _out_of_band_pickle()
+
+
 class Worker(StoppableThread):
     """ Worker runs the procedure and emits information about
     the procedure and its status over a ZMQ TCP port. In a child
     thread, a Recorder is run to write the results to
     """
 
-    def __init__(self, results, log_queue=None, log_level=logging.INFO, port=None):
+    #: Maximum time in seconds to wait for a listener to subscribe to the port,
+    #: if the Worker was told to wait for a subscriber
+    subscribe_timeout = 0.2
+
+    def __init__(self, results, log_queue=None, log_level=logging.INFO, port=None,
+                 wait_for_subscriber=False):
         """ Constructs a Worker to perform the Procedure
         defined in the file at the filepath
+
+        With wait_for_subscriber, a Worker with a port waits up to
+        :attr:`subscribe_timeout` for a listener to subscribe, so that it
+        does not miss the first messages of the procedure.
         """
         super().__init__()
 
         self.port = port
+        self.wait_for_subscriber = wait_for_subscriber
         if not isinstance(results, Results):
             raise ValueError("Invalid Results object during Worker construction")
         self.results = results
@@ -88,11 +115,25 @@ class Worker(StoppableThread):
             super().join(0)
 
     def emit(self, topic, record):
-        """ Emits data of some topic over TCP """
+        """ Emits data of some topic over TCP
+
+        Large numpy arrays in the record are sent from their own memory
+        without being copied, after this method returns. They should
+        therefore not be modified after they were emitted, e.g. by reusing
+        them as buffers for the next data.
+        """
         log.debug("Emitting message: %s %s", topic, record)
 
         try:
-            self.publisher.send_serialized((topic, record), serialize=cloudpickle.dumps)
+            # The topic is sent as its own frame, so subscribers can filter on it
+            if OUT_OF_BAND_PICKLE:
+                buffers = []
+                frames = [topic.encode(), cloudpickle.dumps(
+                    record, protocol=5, buffer_callback=buffers.append)]
+                frames.extend(buffer.raw() for buffer in buffers)
+                self.publisher.send_multipart(frames, copy=False)
+            else:
+                self.publisher.send_multipart((topic.encode(), cloudpickle.dumps(record)))
         except (NameError, AttributeError):
             pass  # No dumps defined
         if topic == 'results':
@@ -148,12 +189,21 @@ class Worker(StoppableThread):
 
         if self.port is not None and zmq is not None:
             try:
-                self.context = zmq.Context()
+                # Sockets share the process-wide context and its I/O thread
+                self.context = zmq.Context.instance()
                 log.debug("Worker ZMQ Context: %r" % self.context)
-                self.publisher = self.context.socket(zmq.PUB)
+                # An XPUB socket receives the subscriptions of the listeners
+                self.publisher = self.context.socket(zmq.XPUB)
+                # Queue more messages for slow subscribers before dropping any
+                self.publisher.setsockopt(zmq.SNDHWM, 10000)
                 self.publisher.bind('tcp://*:%d' % self.port)
+                # Listeners in this process can subscribe without going through TCP
+                self.publisher.bind(INPROC_ADDRESS % self.port)
                 log.info("Worker connected to tcp://*:%d" % self.port)
-                time.sleep(0.01)
+                # Give an expected listener the time to subscribe, so that the
+                # first messages are not lost, but go ahead as soon as one has
+                if self.wait_for_subscriber and self.publisher.poll(self.subscribe_timeout * 1e3):
+                    self.publisher.recv()  # the subscription, which is not needed
             except Exception:
                 log.exception("couldn't connect to ZMQ context")
 
@@ -170,6 +220,9 @@ class Worker(StoppableThread):
             self.handle_error()
         finally:
             self.shutdown()
+            if self.publisher is not None:
+                # Sockets of the shared context are not closed along with it
+                self.publisher.close()
             self.stop()
 
     def __repr__(self):
@@ -28,7 +28,7 @@ log.addHandler(logging.NullHandler())
 
 from pymeasure.instruments import Instrument
 from pymeasure.instruments.validators import strict_discrete_set,\
-    strict_range, joined_validators
+    strict_discrete_range, strict_range
 from time import time
 from pyvisa.errors import VisaIOError
 
@@ -38,8 +38,14 @@ def capitalize_string(string: str, *args, **kwargs):
     return string.upper()
 
 
-# Combine the capitalize function and validator
-string_validator = joined_validators(capitalize_string, strict_discrete_set)
+# Combine the capitalize function and validator, for a frozenset of values
+def string_validator(value, values):
+    value = capitalize_string(value)
+    if value in values:
+        return value
+    raise ValueError('Value of {} is not in the discrete set {}'.format(
+        value, sorted(values)
+    ))
 
 
 class Agilent33220A(Instrument):
@@ -81,8 +87,8 @@ class Agilent33220A(Instrument):
         """ A string property that controls the output waveform. Can be set to:
         SIN<USOID>, SQU<ARE>, RAMP, PULS<E>, NOIS<E>, DC, USER. """,
         validator=string_validator,
-        values=["SINUSOID", "SIN", "SQUARE", "SQU", "RAMP",
-                "PULSE", "PULS", "NOISE", "NOIS", "DC", "USER"],
+        values=frozenset({"SINUSOID", "SIN", "SQUARE", "SQU", "RAMP",
+                          "PULSE", "PULS", "NOISE", "NOIS", "DC", "USER"}),
     )
 
     frequency = Instrument.control(
@@ -107,7 +113,7 @@ class Agilent33220A(Instrument):
         """ A string property that controls the units of the amplitude. Valid
         values are Vpp (default), Vrms, and dBm. Can be set. """,
         validator=string_validator,
-        values=["VPP", "VRMS", "DBM"],
+        values=frozenset({"VPP", "VRMS", "DBM"}),
     )
 
     offset = Instrument.control(
@@ -171,7 +177,7 @@ class Agilent33220A(Instrument):
         duty cycle is retained when changing the period or frequency of the
         waveform. Can be set to: WIDT<H> or DCYC<LE>. """,
         validator=string_validator,
-        values=["WIDT", "WIDTH", "DCYC", "DCYCLE"],
+        values=frozenset({"WIDT", "WIDTH", "DCYC", "DCYCLE"}),
     )
 
     pulse_width = Instrument.control(
@@ -224,7 +230,7 @@ class Agilent33220A(Instrument):
         """ A string property that controls the burst mode. Valid values
         are: TRIG<GERED>, GAT<ED>. This setting can be set. """,
         validator=string_validator,
-        values=["TRIG", "TRIGGERED", "GAT", "GATED"],
+        values=frozenset({"TRIG", "TRIGGERED", "GAT", "GATED"}),
     )
 
     burst_ncycles = Instrument.control(
@@ -232,8 +238,8 @@ class Agilent33220A(Instrument):
         """ An integer property that sets the number of cycles to be output
         when a burst is triggered. Valid values are 1 to 50000. This can be
         set. """,
-        validator=strict_discrete_set,
-        values=range(1, 50001),
+        validator=lambda v, vs: strict_discrete_range(v, vs, step=1),
+        values=[1, 50000],
     )
 
     def trigger(self):
@@ -277,7 +283,7 @@ class Agilent33220A(Instrument):
         are: IMM<EDIATE> (internal), EXT<ERNAL> (rear input), BUS (via trigger
         command). This setting can be set. """,
         validator=string_validator,
-        values=["IMM", "IMMEDIATE", "EXT", "EXTERNAL", "BUS"],
+        values=frozenset({"IMM", "IMMEDIATE", "EXT", "EXTERNAL", "BUS"}),
     )
 
     trigger_state = Instrument.control(
@@ -295,23 +301,27 @@ class Agilent33220A(Instrument):
         function generator. Valid values are: LOC<AL>, REM<OTE>, RWL<OCK>.
         This setting can only be set. """,
         validator=string_validator,
-        values=["LOC", "LOCAL", "REM", "REMOTE", "RWL", "RWLOCK"],
+        values=frozenset({"LOC", "LOCAL", "REM", "REMOTE", "RWL", "RWLOCK"}),
     )
 
+    #: Number of errors that check_errors reads with each compound query
+    ERRORS_PER_QUERY = 5
+
     def check_errors(self):
-        """ Read all errors from the instrument. """
+        """ Read all errors from the instrument. The error queue is read
+        :attr:`ERRORS_PER_QUERY` errors at a time, by chaining the queries
+        into a single command. """
 
         errors = []
+        query = ";".join([":SYST:ERR?"] * self.ERRORS_PER_QUERY)
         while True:
-            err = self.values("SYST:ERR?")
-            if int(err[0]) != 0:
-                errmsg = "Agilent 33220A: %s: %s" % (err[0], err[1])
+            for response in self.ask(query).strip().split(";"):
+                code, message = response.split(",", 1)
+                if int(code) == 0:
+                    return errors
+                errmsg = "Agilent 33220A: %d: %s" % (int(code), message)
                 log.error(errmsg + '\n')
                 errors.append(errmsg)
-            else:
-                break
-
-        return errors
 
     beeper_state = Instrument.control(
         "SYST:BEEP:STAT?", "SYST:BEEP:STAT %d",
@@ -371,15 +371,17 @@ class Agilent33500(Instrument):
             separator = ', '
             data_points_str = [str(item) for item in data_points]  # Turn list entries into strings
             data_string = separator.join(data_points_str)  # Join strings with separator
-            print("DATA:ARB:DAC {}, {}".format(arb_name, data_string))
-            self.write("DATA:ARB:DAC {}, {}".format(arb_name, data_string))
+            command = "DATA:ARB:DAC {}, {}".format(arb_name, data_string)
+            log.debug("Writing arbitrary waveform: %s", command)
+            self.write(command)
             return
         elif data_format == 'float':
             separator = ', '
             data_points_str = [str(item) for item in data_points]  # Turn list entries into strings
             data_string = separator.join(data_points_str)  # Join strings with separator
-            print("DATA:ARB {}, {}".format(arb_name, data_string))
-            self.write("DATA:ARB {}, {}".format(arb_name, data_string))
+            command = "DATA:ARB {}, {}".format(arb_name, data_string)
+            log.debug("Writing arbitrary waveform: %s", command)
+            self.write(command)
             return
         elif data_format == 'binary':
             raise NotImplementedError('The binary format has not yet been implemented. Use "DAC" or "float" instead.')
@@ -22,14 +22,97 @@
 # THE SOFTWARE.
 #
 
-import re
 import logging
+from contextlib import contextmanager
+from functools import lru_cache
 
 log = logging.getLogger(__name__)
 log.addHandler(logging.NullHandler())
 
 from pymeasure.instruments import Instrument
-from pymeasure.instruments.validators import truncated_range, strict_discrete_set
+
+
+def _to_float(value):
+    """ Returns the value converted to a float, or unchanged if it is not a number """
+    try:
+        return float(value)
+    except ValueError:
+        return value
+
+
+@lru_cache(maxsize=16)
+def _parse_configuration(configuration):
+    """ Returns a tuple of the elements of a configuration string, see
+    :meth:`Agilent34450A._conf_parser`. The result is cached, since the
+    instrument returns the same string until its configuration changes, and
+    is a tuple, so that it can not be changed by the callers. """
+    # Split string in elements, which are separated by quotes, commas,
+    # and whitespace
+    elements = configuration.replace('"', ' ').replace(',', ' ').split()
+
+    # The first element is the mode, which is kept as str, and the others are
+    # converted from str to float, where applicable
+    try:
+        return tuple(elements[:1] + list(map(float, elements[1:])))
+    except ValueError:
+        return tuple(elements[:1] + [_to_float(v) for v in elements[1:]])
+
+
+def _reading(docs):
+    """ Returns a property that triggers and reads a single measurement in the
+    active mode, directly converting the reply to a float without the list
+    handling of
+    :meth:`Instrument.measurement <pymeasure.instruments.Instrument.measurement>`. """
+    def fget(self):
+        return float(self.ask(":READ?"))
+
+    fget.__doc__ = docs
+    return property(fget)
+
+
+def _bool_control(get_command, set_command, docs):
+    """ Returns a property that controls a boolean setting of the instrument,
+    which is written as 1 or 0, without the value mapping of
+    :meth:`Instrument.control <pymeasure.instruments.Instrument.control>`. """
+    def fget(self):
+        return bool(int(self.values(get_command)[0]))
+
+    def fset(self, value):
+        if value not in (True, False):
+            raise ValueError('Value of {} is not a boolean'.format(value))
+        self.write(set_command % value)
+
+    fget.__doc__ = docs
+    return property(fget, fset)
+
+
+def _discrete_control(get_command, set_command, docs, values):
+    """ Returns a property that controls a setting of the instrument, which
+    only takes the given values. This behaves as
+    :meth:`Instrument.control <pymeasure.instruments.Instrument.control>` with
+    the :func:`strict_discrete_set <pymeasure.instruments.validators.strict_discrete_set>`
+    validator, but looks the value up in a set rather than scanning the list. """
+    allowed = frozenset(values)
+
+    def fget(self):
+        vals = self.values(get_command)
+        if len(vals) == 1:
+            return vals[0]
+        return vals
+
+    def fset(self, value):
+        try:
+            valid = value in allowed
+        except TypeError:  # unhashable values are never allowed
+            valid = False
+        if not valid:
+            raise ValueError('Value of {} is not in the discrete set {}'.format(
+                value, values
+            ))
+        self.write(set_command % value)
+
+    fget.__doc__ = docs
+    return property(fget, fset)
 
 
 class Agilent34450A(Instrument):
@@ -44,10 +127,18 @@ class Agilent34450A(Instrument):
         print(dmm.voltage)
         dmm.shutdown()
 
+    The ``configure_*`` methods only change the mode if it differs from the
+    one last set through this object. After changing the mode in any other
+    way, e.g. on the front panel, set :attr:`mode` directly or call
+    :meth:`reset`. They write all of their commands at once, which can
+    also be done for any other settings with :meth:`batch_writes`.
+
     """
 
     BOOLS = {True: 1, False: 0}
 
+    _write_buffer = None  # Commands collected by batch_writes
+
     MODES = {'current': 'CURR', 'ac current': 'CURR:AC',
              'voltage': 'VOLT', 'ac voltage': 'VOLT:AC',
              'resistance': 'RES', '4w resistance': 'FRES',
@@ -80,66 +171,112 @@ class Agilent34450A(Instrument):
                 else:
                     self.mode = 'ac voltage'
                 self.write(":configure:freq")
+            self._mode = value
         else:
             raise ValueError('Value %s is not a supported mode for this device.'.format(value))
 
+    def write(self, command):
+        """ Writes the command to the instrument, or collects it if it is written
+        within :meth:`batch_writes`. """
+        if self._write_buffer is not None:
+            self._write_buffer.append(command)
+        else:
+            super().write(command)
+
+    def ask(self, command):
+        """ Writes any commands collected by :meth:`batch_writes`, and then the
+        command, and returns the read response. """
+        self._flush_writes()
+        return super().ask(command)
+
+    def values(self, command, **kwargs):
+        """ Writes any commands collected by :meth:`batch_writes`, and then reads
+        a set of values from the instrument, passing on any key-word arguments. """
+        self._flush_writes()
+        return super().values(command, **kwargs)
+
+    def _flush_writes(self):
+        """ Writes the commands collected so far as a single chained command. """
+        if self._write_buffer:
+            super().write(";".join(self._write_buffer))
+            self._write_buffer = []
+
+    @contextmanager
+    def batch_writes(self):
+        """ Collects the commands that are written within the context, and writes
+        them to the instrument as a single chained command when it exits, or
+        before the next query.
+
+        .. code-block:: python
+
+            with dmm.batch_writes():
+                dmm.voltage_range = 10
+                dmm.voltage_resolution = "MIN"
+
+        """
+        if self._write_buffer is not None:  # already collecting
+            yield
+            return
+        self._write_buffer = []
+        try:
+            yield
+        finally:
+            self._flush_writes()
+            self._write_buffer = None
+
+    def _configure_mode(self, mode):
+        """ Sets the mode, unless it was already set to it by this object. Setting the
+        mode reconfigures the instrument, which can take several seconds. """
+        if mode != self._mode:
+            self.mode = mode
+
     ###############
     # Current (A) #
     ###############
 
-    current = Instrument.measurement(":READ?",
-                                     """ Reads a DC current measurement in Amps, based on the
-                                     active :attr:`~.Agilent34450A.mode`. """
-                                     )
-    current_ac = Instrument.measurement(":READ?",
-                                        """ Reads an AC current measurement in Amps, based on the
-                                        active :attr:`~.Agilent34450A.mode`. """
-                                        )
-    current_range = Instrument.control(
+    current = _reading(
+        """ Reads a DC current measurement in Amps, based on the
+        active :attr:`~.Agilent34450A.mode`. """
+    )
+    current_ac = _reading(
+        """ Reads an AC current measurement in Amps, based on the
+        active :attr:`~.Agilent34450A.mode`. """
+    )
+    current_range = _discrete_control(
         ":SENS:CURR:RANG?", ":SENS:CURR:RANG:AUTO 0;:SENS:CURR:RANG %s",
         """ A property that controls the DC current range in
         Amps, which can take values 100E-6, 1E-3, 10E-3, 100E-3, 1, 10, 
         as well as "MIN", "MAX", or "DEF" (100 mA).
         Auto-range is disabled when this property is set. """,
-        validator=strict_discrete_set,
         values=[100E-6, 1E-3, 10E-3, 100E-3, 1, 10, "MIN", "DEF", "MAX"]
     )
-    current_auto_range = Instrument.control(
+    current_auto_range = _bool_control(
         ":SENS:CURR:RANG:AUTO?", ":SENS:CURR:RANG:AUTO %d",
-        """ A boolean property that toggles auto ranging for DC current. """,
-        validator=strict_discrete_set,
-        values=BOOLS,
-        map_values=True
+        """ A boolean property that toggles auto ranging for DC current. """
     )
-    current_resolution = Instrument.control(
+    current_resolution = _discrete_control(
         ":SENS:CURR:RES?", ":SENS:CURR:RES %s",
         """ A property that controls the resolution in the DC current
         readings, which can take values 3.00E-5, 2.00E-5, 1.50E-6 (5 1/2 digits), 
         as well as "MIN", "MAX", and "DEF" (3.00E-5). """,
-        validator=strict_discrete_set,
         values=[3.00E-5, 2.00E-5, 1.50E-6, "MAX", "MIN", "DEF"]
     )
-    current_ac_range = Instrument.control(
+    current_ac_range = _discrete_control(
         ":SENS:CURR:AC:RANG?", ":SENS:CURR:AC:RANG:AUTO 0;:SENS:CURR:AC:RANG %s",
         """ A property that controls the AC current range in Amps, which can take 
         values 10E-3, 100E-3, 1, 10, as well as "MIN", "MAX", or "DEF" (100 mA).
         Auto-range is disabled when this property is set. """,
-        validator=strict_discrete_set,
         values=[10E-3, 100E-3, 1, 10, "MIN", "MAX", "DEF"]
     )
-    current_ac_auto_range = Instrument.control(
+    current_ac_auto_range = _bool_control(
         ":SENS:CURR:AC:RANG:AUTO?", ":SENS:CURR:AC:RANG:AUTO %d",
-        """ A boolean property that toggles auto ranging for AC current. """,
-        validator=strict_discrete_set,
-        values=BOOLS,
-        map_values=True
+        """ A boolean property that toggles auto ranging for AC current. """
     )
-    current_ac_resolution = Instrument.control(
+    current_ac_resolution = _discrete_control(
         ":SENS:CURR:AC:RES?", ":SENS:CURR:AC:RES %s",
         """ An property that controls the resolution in the AC current
         readings, which can take values 3.00E-5, 2.00E-5, 1.50E-6 (5 1/2 digits), 
         as well as "MIN", "MAX", or "DEF" (1.50E-6). """,
-        validator=strict_discrete_set,
         values=[3.00E-5, 2.00E-5, 1.50E-6, "MAX", "MIN", "DEF"]
     )
 
@@ -147,59 +284,49 @@ class Agilent34450A(Instrument):
     # Voltage (V) #
     ###############
 
-    voltage = Instrument.measurement(":READ?",
-                                     """ Reads a DC voltage measurement in Volts, based on the
-                                     active :attr:`~.Agilent34450A.mode`. """
-                                     )
-    voltage_ac = Instrument.measurement(":READ?",
-                                        """ Reads an AC voltage measurement in Volts, based on the
-                                        active :attr:`~.Agilent34450A.mode`. """
-                                        )
-    voltage_range = Instrument.control(
+    voltage = _reading(
+        """ Reads a DC voltage measurement in Volts, based on the
+        active :attr:`~.Agilent34450A.mode`. """
+    )
+    voltage_ac = _reading(
+        """ Reads an AC voltage measurement in Volts, based on the
+        active :attr:`~.Agilent34450A.mode`. """
+    )
+    voltage_range = _discrete_control(
         ":SENS:VOLT:RANG?", ":SENS:VOLT:RANG:AUTO 0;:SENS:VOLT:RANG %s",
         """ A property that controls the DC voltage range in Volts, which 
         can take values 100E-3, 1, 10, 100, 1000, as well as "MIN", "MAX", or 
         "DEF" (10 V). Auto-range is disabled when this property is set. """,
-        validator=strict_discrete_set,
         values=[100E-3, 1, 10, 100, 1000, "MAX", "MIN", "DEF"]
     )
-    voltage_auto_range = Instrument.control(
+    voltage_auto_range = _bool_control(
         ":SENS:VOLT:RANG:AUTO?", ":SENS:VOLT:RANG:AUTO %d",
-        """ A boolean property that toggles auto ranging for DC voltage. """,
-        validator=strict_discrete_set,
-        values=BOOLS,
-        map_values=True
+        """ A boolean property that toggles auto ranging for DC voltage. """
     )
-    voltage_resolution = Instrument.control(
+    voltage_resolution = _discrete_control(
         ":SENS:VOLT:RES?", ":SENS:VOLT:RES %s",
         """ A property that controls the resolution in the DC voltage
         readings, which can take values 3.00E-5, 2.00E-5, 1.50E-6 (5 1/2 digits), 
         as well as "MIN", "MAX", or "DEF" (1.50E-6). """,
-        validator=strict_discrete_set,
         values=[3.00E-5, 2.00E-5, 1.50E-6, "MAX", "MIN", "DEF"]
     )
-    voltage_ac_range = Instrument.control(
+    voltage_ac_range = _discrete_control(
         ":SENS:VOLT:AC:RANG?", ":SENS:VOLT:RANG:AUTO 0;:SENS:VOLT:AC:RANG %s",
         """ A property that controls the AC voltage range in Volts, which can 
         take values 100E-3, 1, 10, 100, 750, as well as "MIN", "MAX", or "DEF" 
         (10 V).
         Auto-range is disabled when this property is set. """,
-        validator=strict_discrete_set,
         values=[100E-3, 1, 10, 100, 750, "MAX", "MIN", "DEF"]
     )
-    voltage_ac_auto_range = Instrument.control(
+    voltage_ac_auto_range = _bool_control(
         ":SENS:VOLT:AC:RANG:AUTO?", ":SENS:VOLT:AC:RANG:AUTO %d",
-        """ A boolean property that toggles auto ranging for AC voltage. """,
-        validator=strict_discrete_set,
-        values=BOOLS,
-        map_values=True
+        """ A boolean property that toggles auto ranging for AC voltage. """
     )
-    voltage_ac_resolution = Instrument.control(
+    voltage_ac_resolution = _discrete_control(
         ":SENS:VOLT:AC:RES?", ":SENS:VOLT:AC:RES %s",
         """ A property that controls the resolution in the AC voltage readings, 
         which can take values 3.00E-5, 2.00E-5, 1.50E-6 (5 1/2 digits), 
         as well as "MIN", "MAX", or "DEF" (1.50E-6). """,
-        validator=strict_discrete_set,
         values=[3.00E-5, 2.00E-5, 1.50E-6, "MAX", "MIN", "DEF"]
     )
 
@@ -207,62 +334,52 @@ class Agilent34450A(Instrument):
     # Resistance (Ohm) #
     ####################
 
-    resistance = Instrument.measurement(":READ?",
-                                        """ Reads a resistance measurement in Ohms for 2-wire 
-                                        configuration, based on the active 
-                                        :attr:`~.Agilent34450A.mode`. """
-                                        )
-    resistance_4w = Instrument.measurement(":READ?",
-                                           """ Reads a resistance measurement in Ohms for 
-                                           4-wire configuration, based on the active 
-                                           :attr:`~.Agilent34450A.mode`. """
-                                           )
-    resistance_range = Instrument.control(
+    resistance = _reading(
+        """ Reads a resistance measurement in Ohms for 2-wire 
+        configuration, based on the active
+        :attr:`~.Agilent34450A.mode`. """
+    )
+    resistance_4w = _reading(
+        """ Reads a resistance measurement in Ohms for 
+        4-wire configuration, based on the active
+        :attr:`~.Agilent34450A.mode`. """
+    )
+    resistance_range = _discrete_control(
         ":SENS:RES:RANG?", ":SENS:RES:RANG:AUTO 0;:SENS:RES:RANG %s",
         """ A property that controls the 2-wire resistance range in Ohms, which can 
         take values 100, 1E3, 10E3, 100E3, 1E6, 10E6, 100E6, as well as "MIN", "MAX", 
         or "DEF" (1E3).
         Auto-range is disabled when this property is set. """,
-        validator=strict_discrete_set,
         values=[100, 1E3, 10E3, 100E3, 1E6, 10E6, 100E6, "MAX", "MIN", "DEF"]
     )
-    resistance_auto_range = Instrument.control(
+    resistance_auto_range = _bool_control(
         ":SENS:RES:RANG:AUTO?", ":SENS:RES:RANG:AUTO %d",
-        """ A boolean property that toggles auto ranging for 2-wire resistance. """,
-        validator=strict_discrete_set,
-        values=BOOLS,
-        map_values=True
+        """ A boolean property that toggles auto ranging for 2-wire resistance. """
     )
-    resistance_resolution = Instrument.control(
+    resistance_resolution = _discrete_control(
         ":SENS:RES:RES?", ":SENS:RES:RES %s",
         """ A property that controls the resolution in the 2-wire
         resistance readings, which can take values 3.00E-5, 2.00E-5, 1.50E-6 (5 1/2 digits), 
         as well as "MIN", "MAX", or "DEF" (1.50E-6). """,
-        validator=strict_discrete_set,
         values=[3.00E-5, 2.00E-5, 1.50E-6, "MAX", "MIN", "DEF"]
     )
-    resistance_4w_range = Instrument.control(
+    resistance_4w_range = _discrete_control(
         ":SENS:FRES:RANG?", ":SENS:FRES:RANG:AUTO 0;:SENS:FRES:RANG %s",
         """ A property that controls the 4-wire resistance range
         in Ohms, which can take values 100, 1E3, 10E3, 100E3, 1E6, 10E6, 100E6, 
         as well as "MIN", "MAX", or "DEF" (1E3).
         Auto-range is disabled when this property is set. """,
-        validator=strict_discrete_set,
         values=[100, 1E3, 10E3, 100E3, 1E6, 10E6, 100E6, "MAX", "MIN", "DEF"]
     )
-    resistance_4w_auto_range = Instrument.control(
+    resistance_4w_auto_range = _bool_control(
         ":SENS:FRES:RANG:AUTO?", ":SENS:FRES:RANG:AUTO %d",
-        """ A boolean property that toggles auto ranging for 4-wire resistance. """,
-        validator=strict_discrete_set,
-        values=BOOLS,
-        map_values=True
+        """ A boolean property that toggles auto ranging for 4-wire resistance. """
     )
-    resistance_4w_resolution = Instrument.control(
+    resistance_4w_resolution = _discrete_control(
         ":SENS:FRES:RES?", ":SENS:FRES:RES %s",
         """ A property that controls the resolution in the 4-wire
         resistance readings, which can take values 3.00E-5, 2.00E-5, 1.50E-6 (5 1/2 digits), 
         as well as "MIN", "MAX", or "DEF" (1.50E-6). """,
-        validator=strict_discrete_set,
         values=[3.00E-5, 2.00E-5, 1.50E-6, "MAX", "MIN", "DEF"]
     )
 
@@ -270,48 +387,39 @@ class Agilent34450A(Instrument):
     # Frequency (Hz) #
     ##################
 
-    frequency = Instrument.measurement(":READ?",
-                                       """ Reads a frequency measurement in Hz, based on the
-                                       active :attr:`~.Agilent34450A.mode`. """
-                                       )
-    frequency_current_range = Instrument.control(
+    frequency = _reading(
+        """ Reads a frequency measurement in Hz, based on the
+        active :attr:`~.Agilent34450A.mode`. """
+    )
+    frequency_current_range = _discrete_control(
         ":SENS:FREQ:CURR:RANG?", ":SENS:FREQ:CURR:RANG:AUTO 0;:SENS:FREQ:CURR:RANG %s",
         """ A property that controls the current range in Amps for frequency on AC current
         measurements, which can take values 10E-3, 100E-3, 1, 10, as well as "MIN", 
         "MAX", or "DEF" (100 mA).
         Auto-range is disabled when this property is set. """,
-        validator=strict_discrete_set,
         values=[10E-3, 100E-3, 1, 10, "MIN", "MAX", "DEF"]
     )
-    frequency_current_auto_range = Instrument.control(
+    frequency_current_auto_range = _bool_control(
         ":SENS:FREQ:CURR:RANG:AUTO?", ":SENS:FREQ:CURR:RANG:AUTO %d",
-        """ A boolean property that toggles auto ranging for AC current in frequency measurements. """,
-        validator=strict_discrete_set,
-        values=BOOLS,
-        map_values=True
+        """ A boolean property that toggles auto ranging for AC current in frequency measurements. """
     )
-    frequency_voltage_range = Instrument.control(
+    frequency_voltage_range = _discrete_control(
         ":SENS:FREQ:VOLT:RANG?", ":SENS:FREQ:VOLT:RANG:AUTO 0;:SENS:FREQ:VOLT:RANG %s",
         """ A property that controls the voltage range in Volts for frequency on AC voltage 
         measurements, which can take values 100E-3, 1, 10, 100, 750, 
         as well as "MIN", "MAX", or "DEF" (10 V).
         Auto-range is disabled when this property is set. """,
-        validator=strict_discrete_set,
         values=[100E-3, 1, 10, 100, 750, "MAX", "MIN", "DEF"]
     )
-    frequency_voltage_auto_range = Instrument.control(
+    frequency_voltage_auto_range = _bool_control(
         ":SENS:FREQ:VOLT:RANG:AUTO?", ":SENS:FREQ:VOLT:RANG:AUTO %d",
-        """ A boolean property that toggles auto ranging for AC voltage in frequency measurements. """,
-        validator=strict_discrete_set,
-        values=BOOLS,
-        map_values=True
+        """ A boolean property that toggles auto ranging for AC voltage in frequency measurements. """
     )
-    frequency_aperture = Instrument.control(
+    frequency_aperture = _discrete_control(
         ":SENS:FREQ:APER?", ":SENS:FREQ:APER %s",
         """ A property that controls the frequency aperture in seconds,
         which sets the integration period and measurement speed. Takes values
         100 ms, 1 s, as well as "MIN", "MAX", or "DEF" (1 s). """,
-        validator=strict_discrete_set,
         values=[100E-3, 1, "MIN", "MAX", "DEF"]
     )
 
@@ -319,53 +427,49 @@ class Agilent34450A(Instrument):
     # Temperature (C) #
     ###################
 
-    temperature = Instrument.measurement(":READ?",
-                                         """ Reads a temperature measurement in Celsius, based on the
-                                         active :attr:`~.Agilent34450A.mode`. """
-                                         )
+    temperature = _reading(
+        """ Reads a temperature measurement in Celsius, based on the
+        active :attr:`~.Agilent34450A.mode`. """
+    )
 
     #############
     # Diode (V) #
     #############
 
-    diode = Instrument.measurement(":READ?",
-                                   """ Reads a diode measurement in Volts, based on the 
-                                   active :attr:`~.Agilent34450A.mode`. """
-                                   )
+    diode = _reading(
+        """ Reads a diode measurement in Volts, based on the 
+        active :attr:`~.Agilent34450A.mode`. """
+    )
 
     ###################
     # Capacitance (F) #
     ###################
 
-    capacitance = Instrument.measurement(":READ?",
-                                         """ Reads a capacitance measurement in Farads, 
-                                         based on the active :attr:`~.Agilent34450A.mode`. """
-                                         )
-    capacitance_range = Instrument.control(
+    capacitance = _reading(
+        """ Reads a capacitance measurement in Farads, 
+        based on the active :attr:`~.Agilent34450A.mode`. """
+    )
+    capacitance_range = _discrete_control(
         ":SENS:CAP:RANG?", ":SENS:CAP:RANG:AUTO 0;:SENS:CAP:RANG %s",
         """ A property that controls the capacitance range
         in Farads, which can take values 1E-9, 10E-9, 100E-9, 1E-6, 10E-6, 100E-6, 
         1E-3, 10E-3, as well as "MIN", "MAX", or "DEF" (1E-6).
         Auto-range is disabled when this property is set. """,
-        validator=strict_discrete_set,
         values=[1E-9, 10E-9, 100E-9, 1E-6, 10E-6, 100E-6, 1E-3, 10E-3, "MAX", "MIN", "DEF"]
     )
-    capacitance_auto_range = Instrument.control(
+    capacitance_auto_range = _bool_control(
         ":SENS:CAP:RANG:AUTO?", ":SENS:CAP:RANG:AUTO %d",
-        """ A boolean property that toggles auto ranging for capacitance. """,
-        validator=strict_discrete_set,
-        values=BOOLS,
-        map_values=True
+        """ A boolean property that toggles auto ranging for capacitance. """
     )
 
     ####################
     # Continuity (Ohm) #
     ####################
 
-    continuity = Instrument.measurement(":READ?",
-                                        """ Reads a continuity measurement in Ohms, 
-                                        based on the active :attr:`~.Agilent34450A.mode`. """
-                                        )
+    continuity = _reading(
+        """ Reads a continuity measurement in Ohms, 
+        based on the active :attr:`~.Agilent34450A.mode`. """
+    )
 
     def __init__(self, adapter, **kwargs):
         super(Agilent34450A, self).__init__(
@@ -373,17 +477,29 @@ class Agilent34450A(Instrument):
         )
         # Configuration changes can necessitate up to 8.8 secs (per datasheet)
         self.adapter.connection.timeout = 10000
+        self._mode = None  # Last mode set, so that configure_* can skip setting it again
         self.check_errors()
 
+    def reset(self):
+        """ Resets the instrument. """
+        super().reset()
+        self._mode = None
+
+    #: Number of errors that check_errors reads with each compound query
+    ERRORS_PER_QUERY = 5
+
     def check_errors(self):
-        """ Read all errors from the instrument."""
+        """ Read all errors from the instrument. The error queue is read
+        :attr:`ERRORS_PER_QUERY` errors at a time, by chaining the queries
+        into a single command."""
+        query = ";".join([":SYST:ERR?"] * self.ERRORS_PER_QUERY)
         while True:
-            err = self.values(":SYST:ERR?")
-            if int(err[0]) != 0:
-                errmsg = "Agilent 34450A: %s: %s" % (err[0], err[1])
+            for response in self.ask(query).strip().split(";"):
+                code, message = response.split(",", 1)
+                if int(code) == 0:
+                    return
+                errmsg = "Agilent 34450A: %d: %s" % (int(code), message)
                 log.error(errmsg + '\n')
-            else:
-                break
 
     def configure_voltage(self, voltage_range="AUTO", ac=False, resolution="DEF"):
         """ Configures the instrument to measure voltage.
@@ -396,22 +512,23 @@ class Agilent34450A(Instrument):
         :param resolution: Desired resolution, can be 3.00E-5, 2.00E-5,
                 1.50E-6 (5 1/2 digits), as well as "MIN", "MAX", or "DEF" (1.50E-6).
         """
-        if ac is True:
-            self.mode = 'ac voltage'
-            self.voltage_ac_resolution = resolution
-            if voltage_range == "AUTO":
-                self.voltage_ac_auto_range = True
-            else:
-                self.voltage_ac_range = voltage_range
-        elif ac is False:
-            self.mode = 'voltage'
-            self.voltage_resolution = resolution
-            if voltage_range == "AUTO":
-                self.voltage_auto_range = True
+        with self.batch_writes():
+            if ac is True:
+                self._configure_mode('ac voltage')
+                self.voltage_ac_resolution = resolution
+                if voltage_range == "AUTO":
+                    self.voltage_ac_auto_range = True
+                else:
+                    self.voltage_ac_range = voltage_range
+            elif ac is False:
+                self._configure_mode('voltage')
+                self.voltage_resolution = resolution
+                if voltage_range == "AUTO":
+                    self.voltage_auto_range = True
+                else:
+                    self.voltage_range = voltage_range
             else:
-                self.voltage_range = voltage_range
-        else:
-            raise TypeError('Value of ac should be a boolean.')
+                raise TypeError('Value of ac should be a boolean.')
 
     def configure_current(self, current_range="AUTO", ac=False, resolution="DEF"):
         """ Configures the instrument to measure current.
@@ -424,22 +541,23 @@ class Agilent34450A(Instrument):
         :param resolution: Desired resolution, can be 3.00E-5, 2.00E-5, 1.50E-6 (5 1/2 digits),
                 as well as "MIN", "MAX", or "DEF" (1.50E-6).
         """
-        if ac is True:
-            self.mode = 'ac current'
-            self.current_ac_resolution = resolution
-            if current_range == "AUTO":
-                self.current_ac_auto_range = True
-            else:
-                self.current_ac_range = current_range
-        elif ac is False:
-            self.mode = 'current'
-            self.current_resolution = resolution
-            if current_range == "AUTO":
-                self.current_auto_range = True
+        with self.batch_writes():
+            if ac is True:
+                self._configure_mode('ac current')
+                self.current_ac_resolution = resolution
+                if current_range == "AUTO":
+                    self.current_ac_auto_range = True
+                else:
+                    self.current_ac_range = current_range
+            elif ac is False:
+                self._configure_mode('current')
+                self.current_resolution = resolution
+                if current_range == "AUTO":
+                    self.current_auto_range = True
+                else:
+                    self.current_range = current_range
             else:
-                self.current_range = current_range
-        else:
-            raise TypeError('Value of ac should be a boolean.')
+                raise TypeError('Value of ac should be a boolean.')
 
     def configure_resistance(self, resistance_range="AUTO", wires=2, resolution="DEF"):
         """ Configures the instrument to measure resistance.
@@ -450,23 +568,24 @@ class Agilent34450A(Instrument):
         :param resolution: Desired resolution, can be 3.00E-5, 2.00E-5, 1.50E-6 (5 1/2 digits),
                 as well as "MIN", "MAX", or "DEF" (1.50E-6).
         """
-        if wires == 2:
-            self.mode = 'resistance'
-            self.resistance_resolution = resolution
-            if resistance_range == "AUTO":
-                self.resistance_auto_range = True
-            else:
-                self.resistance_range = resistance_range
-        elif wires == 4:
-            self.mode = '4w resistance'
-            self.resistance_4w_resolution = resolution
-            if resistance_range == "AUTO":
-                self.resistance_4w_auto_range = True
+        with self.batch_writes():
+            if wires == 2:
+                self._configure_mode('resistance')
+                self.resistance_resolution = resolution
+                if resistance_range == "AUTO":
+                    self.resistance_auto_range = True
+                else:
+                    self.resistance_range = resistance_range
+            elif wires == 4:
+                self._configure_mode('4w resistance')
+                self.resistance_4w_resolution = resolution
+                if resistance_range == "AUTO":
+                    self.resistance_4w_auto_range = True
+                else:
+                    self.resistance_4w_range = resistance_range
             else:
-                self.resistance_4w_range = resistance_range
-        else:
-            raise ValueError("Incorrect wires value, Agilent 34450A only supports 2 or 4 wire"
-                             "resistance meaurement.")
+                raise ValueError("Incorrect wires value, Agilent 34450A only supports 2 or 4 wire"
+                                 "resistance meaurement.")
 
     def configure_frequency(self, measured_from="voltage_ac",
                             measured_from_range="AUTO", aperture="DEF"):
@@ -480,32 +599,33 @@ class Agilent34450A(Instrument):
         :param aperture: Aperture time in Seconds, can be 100 ms, 1 s, as well as "MIN", "MAX",
                         or "DEF" (1 s).
         """
-        if measured_from == "voltage_ac":
-            self.mode = "voltage frequency"
-            if measured_from_range == "AUTO":
-                self.frequency_voltage_auto_range = True
-            else:
-                self.frequency_voltage_range = measured_from_range
-        elif measured_from == "current_ac":
-            self.mode = "current frequency"
-            if measured_from_range == "AUTO":
-                self.frequency_current_auto_range = True
+        with self.batch_writes():
+            if measured_from == "voltage_ac":
+                self._configure_mode("voltage frequency")
+                if measured_from_range == "AUTO":
+                    self.frequency_voltage_auto_range = True
+                else:
+                    self.frequency_voltage_range = measured_from_range
+            elif measured_from == "current_ac":
+                self._configure_mode("current frequency")
+                if measured_from_range == "AUTO":
+                    self.frequency_current_auto_range = True
+                else:
+                    self.frequency_current_range = measured_from_range
             else:
-                self.frequency_current_range = measured_from_range
-        else:
-            raise ValueError('Incorrect value for measured_from parameter. Use '
-                             '"voltage_ac" or "current_ac".')
-        self.frequency_aperture = aperture
+                raise ValueError('Incorrect value for measured_from parameter. Use '
+                                 '"voltage_ac" or "current_ac".')
+            self.frequency_aperture = aperture
 
     def configure_temperature(self):
         """ Configures the instrument to measure temperature.
         """
-        self.mode = 'temperature'
+        self._configure_mode('temperature')
 
     def configure_diode(self):
         """ Configures the instrument to measure diode voltage.
         """
-        self.mode = 'diode'
+        self._configure_mode('diode')
 
     def configure_capacitance(self, capacitance_range="AUTO"):
         """ Configures the instrument to measure capacitance.
@@ -514,16 +634,17 @@ class Agilent34450A(Instrument):
                                     1E-9, 10E-9, 100E-9, 1E-6, 10E-6, 100E-6, 1E-3, 10E-3,
                                     as well as "MIN", "MAX", "DEF" (1E-6), or "AUTO".
         """
-        self.mode = 'capacitance'
-        if capacitance_range == "AUTO":
-            self.capacitance_auto_range = True
-        else:
-            self.capacitance_range = capacitance_range
+        with self.batch_writes():
+            self._configure_mode('capacitance')
+            if capacitance_range == "AUTO":
+                self.capacitance_auto_range = True
+            else:
+                self.capacitance_range = capacitance_range
 
     def configure_continuity(self):
         """ Configures the instrument to measure continuity.
         """
-        self.mode = 'continuity'
+        self._configure_mode('continuity')
 
     def beep(self):
         """ Sounds a system beep.
@@ -533,7 +654,7 @@ class Agilent34450A(Instrument):
     def _conf_parser(self, conf_values):
         """
         Parse the string of configuration parameters read from Agilent34450A with
-        command ":configure?" and returns a list of parameters.
+        command ":configure?" and returns a tuple of parameters.
 
         Use cases:
 
@@ -542,7 +663,7 @@ class Agilent34450A(Instrument):
 
         becomes
 
-        ["CURR", +1000000E-01, +1.500000E-06]
+        ("CURR", +1000000E-01, +1.500000E-06)
         """
         # If not already one string, get one string
 
@@ -551,21 +672,4 @@ class Agilent34450A(Instrument):
         else:
             one_long_string = conf_values
 
-        # Split string in elements
-        list_of_elements = re.split('["\s,]', one_long_string)
-
-        # Eliminate empty string elements
-        list_without_empty_elements = list(filter(lambda v: v != '', list_of_elements))
-
-        # Convert numbers from str to float, where applicable
-        for i, v in enumerate(list_without_empty_elements):
-            try:
-                list_without_empty_elements[i] = float(v)
-            except ValueError as e:
-                log.error(e)
-
-        return list_without_empty_elements
-
-
-
-
+        return _parse_configuration(one_long_string)
@@ -525,10 +525,6 @@ class AgilentB1500(Instrument):
         self.write("FMT %d, %d" % (output_format, mode))
         self.check_errors()
         if self._smu_names == {}:
-            print(
-                ('No SMU names available for formatting, '
-                 'instead channel numbers will be used. '
-                 'Call data_format after initializing all SMUs.'))
             log.info(
                 ('No SMU names available for formatting, '
                  'instead channel numbers will be used. '
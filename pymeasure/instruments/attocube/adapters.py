@@ -22,8 +22,8 @@
 # THE SOFTWARE.
 #
 
-import re
 import time
+from time import monotonic
 
 from pymeasure.adapters import TelnetAdapter
 
@@ -35,25 +35,27 @@ class AttocubeConsoleAdapter(TelnetAdapter):
     :param host: host address of the instrument
     :param port: TCPIP port
     :param passwd: password required to open the connection
+    :param reply_timeout: maximum time in seconds to wait for a complete
+        reply, after which a TimeoutError is raised
     :param kwargs: Any valid key-word argument for TelnetAdapter
     """
-    # compiled regular expression for finding numerical values in reply strings
-    _reg_value = re.compile(r"\w+\s+=\s+(\w+)")
-
-    def __init__(self, host, port, passwd, **kwargs):
+    def __init__(self, host, port, passwd, reply_timeout=5, **kwargs):
         self.read_termination = '\r\n'
         self.write_termination = self.read_termination
+        self._read_termination_bytes = self.read_termination.encode()
+        self.reply_timeout = reply_timeout
         kwargs.setdefault('preprocess_reply', self.extract_value)
         super().__init__(host, port, **kwargs)
         time.sleep(self.query_delay)
         super().read()  # clear messages sent upon opening the connection
         # send password and check authorization
         self.write(passwd, check_ack=False)
-        time.sleep(self.query_delay)
-        ret = super().read()
-        authmsg = ret.split(self.read_termination)[1]
-        if authmsg != 'Authorization success':
-            raise Exception(f"Attocube authorization failed '{authmsg}'")
+        deadline = monotonic() + self.reply_timeout
+        self._read_until(b'Authorization ', deadline)
+        authmsg = self._read_until(self._read_termination_bytes, deadline)
+        authmsg = authmsg.rstrip(self._read_termination_bytes).decode()
+        if authmsg != 'success':
+            raise Exception(f"Attocube authorization failed 'Authorization {authmsg}'")
         # switch console echo off
         _ = self.ask('echo off')
 
@@ -65,9 +67,9 @@ class AttocubeConsoleAdapter(TelnetAdapter):
         :param reply: reply string
         :returns: string with only the numerical value, or the original string
         """
-        r = self._reg_value.search(reply)
-        if r:
-            return r.groups()[0]
+        value = reply.partition('=')[2].split(None, 1)
+        if value:
+            return value[0]
         else:
             return reply
 
@@ -79,12 +81,47 @@ class AttocubeConsoleAdapter(TelnetAdapter):
         :param msg: optional message for the eventual error
         """
         if reply != 'OK':
-            if msg == "":  # clear buffer
+            if msg == "":
                 msg = reply
-                super().read()
             raise ValueError("AttocubeConsoleAdapter: Error after command "
                              f"{self.lastcommand} with message {msg}")
 
+    def _read_until(self, expected, deadline):
+        """ Reads up to and including the expected bytes, unless the deadline
+        passes first.
+
+        :param expected: bytes which end the data to be read
+        :param deadline: time of :func:`time.monotonic` until which to wait
+        :returns: bytes read from the instrument
+        """
+        data = self.connection.read_until(expected,
+                                          max(deadline - monotonic(), 0))
+        if not data.endswith(expected):
+            raise TimeoutError(
+                "AttocubeConsoleAdapter: No complete reply within the timeout, "
+                f"received {data!r}")
+        return data
+
+    def _read_reply(self, deadline=None):
+        """ Reads the lines of a reply up to the acknowledgement line, as
+        soon as it is received.
+
+        :param deadline: time of :func:`time.monotonic` until which to wait
+            for the reply, by default :attr:`reply_timeout` from now
+        :returns: tuple of the reply to the command and the acknowledgement
+        """
+        if deadline is None:
+            deadline = monotonic() + self.reply_timeout
+        # one would want to read up to self.read_termination below, but this
+        # is not possible because of a firmware bug resulting in inconsistent
+        # line endings
+        lines = []
+        line = self._read_until(b'\n', deadline).decode().strip('\r\n')
+        while line not in ('OK', 'ERROR'):
+            lines.append(line)
+            line = self._read_until(b'\n', deadline).decode().strip('\r\n')
+        return self.read_termination.join(lines).strip(self.read_termination), line
+
     def read(self):
         """ Reads a reply of the instrument which consists of two or more
         lines. The first ones are the reply to the command while the last one
@@ -93,12 +130,7 @@ class AttocubeConsoleAdapter(TelnetAdapter):
 
         :returns: String ASCII response of the instrument.
         """
-        raw = super().read().strip(self.read_termination)
-        # one would want to use self.read_termination as 'sep' below, but this
-        # is not possible because of a firmware bug resulting in inconsistent
-        # line endings
-        ret, ack = raw.rsplit(sep='\n', maxsplit=1)
-        ret = ret.strip('\r')  # strip possible CR char
+        ret, ack = self._read_reply()
         self.check_acknowledgement(ack, ret)
         return ret
 
@@ -113,9 +145,10 @@ class AttocubeConsoleAdapter(TelnetAdapter):
         self.lastcommand = command
         super().write(command + self.write_termination)
         if check_ack:
-            reply = self.connection.read_until(self.read_termination.encode())
-            msg = reply.decode().strip(self.read_termination)
-            self.check_acknowledgement(msg)
+            # an error message is followed by the acknowledgement, so that the
+            # whole reply is read and nothing is left in the buffer
+            msg, ack = self._read_reply()
+            self.check_acknowledgement(ack, msg)
 
     def ask(self, command):
         """ Writes a command to the instrument and returns the resulting ASCII
@@ -125,5 +158,25 @@ class AttocubeConsoleAdapter(TelnetAdapter):
         :returns: String ASCII response of the instrument
         """
         self.write(command, check_ack=False)
-        time.sleep(self.query_delay)
         return self.read()
+
+    def ask_many(self, commands, timeout=None):
+        """ Writes several commands to the instrument at once and returns
+        their ASCII responses, which saves a round trip for each but the first
+        command. In case any reply is not OK a ValueError is raised for the
+        first command that failed, after all replies were read.
+
+        :param commands: list of command strings to be sent to the instrument
+        :param timeout: maximum time in seconds to wait for all replies, after
+            which a TimeoutError is raised. By default each reply may take up
+            to :attr:`reply_timeout`.
+        :returns: list of String ASCII responses, one for each command
+        """
+        super().write(''.join(command + self.write_termination
+                              for command in commands))
+        deadline = None if timeout is None else monotonic() + timeout
+        replies = [(command, *self._read_reply(deadline)) for command in commands]
+        for command, ret, ack in replies:
+            self.lastcommand = command
+            self.check_acknowledgement(ack, ret)
+        return [ret for command, ret, ack in replies]
@@ -58,6 +58,24 @@ truncated_int_array_strict_length = joined_validators(strict_length,
                                                       truncated_int_array)
 
 
+def static_measurement(get_command, docs, **kwargs):
+    """ Returns a property like :meth:`Instrument.measurement`, for values
+    which do not change during a session. The value is only read from the
+    instrument on the first access, and then kept until
+    :code:`refresh_static` is called.
+    """
+    measurement = Instrument.measurement(get_command, docs, **kwargs)
+
+    def fget(self):
+        values = self.__dict__.setdefault('_static_values', {})
+        if get_command not in values:
+            values[get_command] = measurement.fget(self)
+        return values[get_command]
+
+    fget.__doc__ = docs
+    return property(fget)
+
+
 class Axis(object):
     """ Represents a single open loop axis of the Attocube ANC350
 
@@ -65,8 +83,8 @@ class Axis(object):
     :param controller: ANC300Controller instance used for the communication
     """
 
-    serial_nr = Instrument.measurement("getser",
-                                       "Serial number of the axis")
+    serial_nr = static_measurement("getser",
+                                   "Serial number of the axis")
 
     voltage = Instrument.control(
             "getv", "setv %.3f",
@@ -140,6 +158,12 @@ class Axis(object):
         self.axis = str(axis)
         self.controller = controller
 
+    def refresh_static(self):
+        """ Discards the values of the static measurements, e.g. after the
+        axis was exchanged, so that they are read again on the next access.
+        """
+        self.__dict__.pop('_static_values', None)
+
     def _add_axis_id(self, command):
         """ add axis id to a command string at the correct position after the
         initial command, but before a potential value
@@ -147,9 +171,10 @@ class Axis(object):
         :param command: command string
         :returns: command string with added axis id
         """
-        cmdparts = command.split()
-        cmdparts.insert(1, self.axis)
-        return ' '.join(cmdparts)
+        cmd, _, value = command.strip().partition(' ')
+        if value:
+            return f"{cmd} {self.axis} {value}"
+        return f"{cmd} {self.axis}"
 
     def ask(self, command, **kwargs):
         return self.controller.ask(self._add_axis_id(command), **kwargs)
@@ -164,30 +189,41 @@ class Axis(object):
         """ Stop any motion of the axis """
         self.write('stop')
 
-    def move(self, steps, gnd=True):
+    def move(self, steps, gnd=True, timeout=None):
         """ Move 'steps' steps in the direction given by the sign of the
         argument. This method will change the mode of the axis automatically
         and ground the axis on the end if 'gnd' is True. The method returns
-        only when the movement is finished.
+        only when the movement is finished. All commands of the movement are
+        sent at once, see :meth:`ANC300Controller.write_many`.
 
         :param steps: finite integer value of steps to be performed. A positive
             sign corresponds to upwards steps, a negative sign to downwards
             steps.
         :param gnd: bool, flag to decide if the axis should be grounded after
             completion of the movement
+        :param timeout: maximum time in seconds for the movement, after which
+            a TimeoutError is raised while the axis may still be moving. By
+            default it is the duration of the steps at the stepping frequency,
+            which is read from the instrument for this, plus the reply timeout
+            of the adapter.
         """
-        self.mode = 'stp'
+        if timeout is None:
+            timeout = (abs(steps) / self.frequency
+                       + self.controller.adapter.reply_timeout)
+        commands = ['setm stp']
         # perform the movement
         if steps > 0:
-            self.stepu = steps
+            commands.append('stepu %d' % steps)
         elif steps < 0:
-            self.stepd = abs(steps)
+            commands.append('stepd %d' % abs(steps))
         else:
             pass  # do not set stepu/d to 0 since it triggers a continous move
         # wait for the move to finish
-        self.write('stepw')
+        commands.append('stepw')
         if gnd:
-            self.mode = 'gnd'
+            commands.append('setm gnd')
+        self.controller.write_many([self._add_axis_id(c) for c in commands],
+                                   timeout=timeout)
 
     def measure_capacity(self):
         """ Obtains a new measurement of the capacity. The mode of the axis
@@ -208,14 +244,17 @@ class ANC300Controller(Instrument):
     :param axisnames: a list of axis names which will be used to create
                       properties with these names
     :param passwd: password for the attocube standard console
-    :param query_delay: delay between sending and reading (default 0.05 sec)
-    :param kwargs: Any valid key-word argument for TelnetAdapter
+    :param query_delay: delay before reading the messages sent upon opening
+                        the connection (default 0.05 sec); replies to commands
+                        are read as soon as they are complete
+    :param kwargs: Any valid key-word argument for AttocubeConsoleAdapter,
+                   e.g. reply_timeout
     """
-    version = Instrument.measurement(
+    version = static_measurement(
            "ver", """ Version number and instrument identification """
            )
 
-    controllerBoardVersion = Instrument.measurement(
+    controllerBoardVersion = static_measurement(
            "getcser", """ Serial number of the controller board """
            )
 
@@ -229,17 +268,41 @@ class ANC300Controller(Instrument):
         )
         for i, axis in enumerate(axisnames):
             setattr(self, axis, Axis(self, i+1))
+        self._axes = [getattr(self, axis) for axis in axisnames]
+
+    def refresh_static(self):
+        """ Discards the values of the static measurements of the controller
+        and its axes, e.g. after a firmware update, so that they are read
+        again on the next access.
+        """
+        self.__dict__.pop('_static_values', None)
+        for axis in self._axes:
+            axis.refresh_static()
+
+    def write_many(self, commands, timeout=None):
+        """ Writes several commands to the instrument at once and checks the
+        acknowledgement of each, see
+        :meth:`AttocubeConsoleAdapter.ask_many <pymeasure.instruments.attocube.adapters.AttocubeConsoleAdapter.ask_many>`.
+
+        :param commands: list of command strings to be sent to the instrument
+        :param timeout: maximum time in seconds to wait for all
+            acknowledgements, by default the reply timeout for each
+        """
+        self.adapter.ask_many(commands, timeout=timeout)
+
+    def read_all_voltages(self):
+        """ Reads the stepping voltages of all axis at once.
+
+        :returns: list of the voltages in volts, in the order of the axis
+        """
+        replies = self.adapter.ask_many(
+            [axis._add_axis_id('getv') for axis in self._axes])
+        return [float(self.adapter.extract_value(reply)) for reply in replies]
 
     def ground_all(self):
         """ Grounds all axis of the controller. """
-        for attr in dir(self):
-            attribute = getattr(self, attr)
-            if isinstance(attribute, Axis):
-                attribute.mode = 'gnd'
+        self.write_many([axis._add_axis_id('setm gnd') for axis in self._axes])
 
     def stop_all(self):
         """ Stop all movements of the axis. """
-        for attr in dir(self):
-            attribute = getattr(self, attr)
-            if isinstance(attribute, Axis):
-                attribute.stop()
+        self.write_many([axis._add_axis_id('stop') for axis in self._axes])
@@ -34,6 +34,45 @@ log = logging.getLogger(__name__)
 log.addHandler(logging.NullHandler())
 
 
+def _set_value_mapper(values, map_values, name):
+    """ Returns a function that maps a validated value onto the value
+    formatted into the set command. This decision is taken once, when the
+    property is created, rather than on every call of the setter.
+    """
+    if not map_values:
+        return lambda value: value
+    elif isinstance(values, (list, tuple, range)):
+        return values.index
+    elif isinstance(values, dict):
+        return values.__getitem__
+    else:
+        def invalid(value):
+            raise ValueError(
+                'Values of type `{}` are not allowed '
+                'for {}'.format(type(values), name)
+            )
+        return invalid
+
+
+def _setter(set_command, validator, values, set_process, map_value,
+            check_set_errors):
+    """ Returns the setter function for a property, where error checking
+    is only included if requested.
+    """
+    def fset(self, value):
+        value = map_value(set_process(validator(value, values)))
+        self.write(set_command % value)
+
+    if not check_set_errors:
+        return fset
+
+    def fset_checked(self, value):
+        fset(self, value)
+        self.check_errors()
+
+    return fset_checked
+
+
 class Instrument(object):
     """ This provides the base class for all Instruments, which is
     independent of the particular Adapter used to connect for
@@ -63,14 +102,6 @@ class Instrument(object):
 
         self.get = Object()
 
-        # TODO: Determine case basis for the addition of these methods
-        if includeSCPI:
-            # Basic SCPI commands
-            self.status = self.measurement("*STB?",
-                                           """ Returns the status of the instrument """)
-            self.complete = self.measurement("*OPC?",
-                                             """ TODO: Add this doc """)
-
         self.isShutdown = False
         log.info("Initializing %s." % self.name)
 
@@ -82,6 +113,26 @@ class Instrument(object):
         else:
             return "Warning: Property not implemented."
 
+    # TODO: Determine case basis for the addition of these properties
+    # The basic SCPI commands are defined once on the class, rather than
+    # being rebuilt for every instance, so that subclasses can override them
+    @property
+    def status(self):
+        """ Requests and returns the status byte of the instrument. """
+        if self.SCPI:
+            return self.values("*STB?")[0]
+        else:
+            return "Warning: Property not implemented."
+
+    @property
+    def complete(self):
+        """ Requests and returns the operation complete state of the
+        instrument (1 when all pending operations have finished). """
+        if self.SCPI:
+            return self.values("*OPC?")[0]
+        else:
+            return "Warning: Property not implemented."
+
     # Wrapper functions for the Adapter object
     def ask(self, command):
         """ Writes the command to the instrument through the adapter
@@ -171,22 +222,11 @@ class Instrument(object):
                 vals = get_process(vals)
                 return vals
 
-        def fset(self, value):
-            value = set_process(validator(value, values))
-            if not map_values:
-                pass
-            elif isinstance(values, (list, tuple, range)):
-                value = values.index(value)
-            elif isinstance(values, dict):
-                value = values[value]
-            else:
-                raise ValueError(
-                    'Values of type `{}` are not allowed '
-                    'for Instrument.control'.format(type(values))
-                )
-            self.write(set_command % value)
-            if check_set_errors:
-                self.check_errors()
+        fset = _setter(
+            set_command, validator, values, set_process,
+            _set_value_mapper(values, map_values, 'Instrument.control'),
+            check_set_errors
+        )
 
         # Add the specified document string to the getter
         fget.__doc__ = docs
@@ -273,22 +313,11 @@ class Instrument(object):
         def fget(self):
             raise LookupError("Instrument.setting properties can not be read.")
 
-        def fset(self, value):
-            value = set_process(validator(value, values))
-            if not map_values:
-                pass
-            elif isinstance(values, (list, tuple, range)):
-                value = values.index(value)
-            elif isinstance(values, dict):
-                value = values[value]
-            else:
-                raise ValueError(
-                    'Values of type `{}` are not allowed '
-                    'for Instrument.control'.format(type(values))
-                )
-            self.write(set_command % value)
-            if check_set_errors:
-                self.check_errors()
+        fset = _setter(
+            set_command, validator, values, set_process,
+            _set_value_mapper(values, map_values, 'Instrument.setting'),
+            check_set_errors
+        )
 
         # Add the specified document string to the getter
         fget.__doc__ = docs
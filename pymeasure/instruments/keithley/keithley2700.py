@@ -297,7 +297,6 @@ class Keithley2700(Instrument, KeithleyBuffer):
         while code != 0:
             t = time.time()
             log.info("Keithley 2700 reported error: %d, %s" % (code, message))
-            print(code, message)
             code, message = self.error
             if (time.time() - t) > 10:
                 log.warning("Timed out for Keithley 2700 error retrieval.")
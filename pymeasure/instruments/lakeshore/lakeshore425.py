@@ -26,7 +26,7 @@ from pymeasure.instruments import Instrument
 from pymeasure.instruments.validators import strict_discrete_set, truncated_discrete_set
 from .adapters import LakeShoreUSBAdapter
 
-from time import sleep
+from time import monotonic, sleep
 import numpy as np
 
 
@@ -74,6 +74,10 @@ class LakeShore425(Instrument):
         map_values=True
     )
 
+    #: Whether the instrument answers several chained field queries, which
+    #: :meth:`measure` sets to False if it does not
+    chained_queries = True
+
     def __init__(self, port):
         super(LakeShore425, self).__init__(
             LakeShoreUSBAdapter(port),
@@ -114,14 +118,58 @@ class LakeShore425(Instrument):
         """ Initiates the zero field sequence to calibrate the probe """
         self.write("ZPROBE")
 
-    def measure(self, points, has_aborted=lambda: False, delay=1e-3):
+    def measure(self, points, has_aborted=lambda: False, delay=1e-3, batch=1):
         """Returns the mean and standard deviation of a given number
-        of points while blocking
+        of points while blocking, reading one point per :code:`delay`,
+        including the time taken to read it. Only the statistics are
+        kept, not the points, and if the measurement is aborted they are
+        those of the points read so far.
+
+        With :code:`batch` larger than 1, up to that many points are read
+        by chained field queries at a time, which saves a round trip for
+        each but the first point of a batch. These points are read back to
+        back, and are then followed by the delay of all of them, so they
+        are not spread over time as single points are. If the instrument
+        does not answer the chained queries, the points are read singly,
+        and :attr:`chained_queries` is set to False to do so from then on.
         """
-        data = np.zeros(points, dtype=np.float32)
-        for i in range(points):
+        if not self.chained_queries:
+            batch = 1
+        count, mean, m2 = 0, 0., 0.
+        deadline = monotonic()
+        while count < points:
             if has_aborted():
                 break
-            data[i] = self.field
-            sleep(delay)
-        return data.mean(), data.std()
+            size = min(batch, points - count)
+            try:
+                data = np.array(self.values(
+                    ";".join(["RDGFIELD?"] * size), separator=";"
+                ), dtype=np.float64)
+                if data.size != size:
+                    raise ValueError("Expected %d field readings, got %d" % (
+                        size, data.size))
+            except ValueError:
+                if size == 1:
+                    raise
+                # the instrument does not answer chained queries
+                self.chained_queries = False
+                batch = 1
+                continue
+            # combine the statistics of the batch with those of the previous
+            # points, which is numerically stable (Chan et al.)
+            data_mean = data.mean()
+            delta = data_mean - mean
+            total = count + size
+            mean += delta * size / total
+            m2 += np.square(data - data_mean).sum() + delta**2 * count * size / total
+            count = total
+            deadline += delay * size
+            slack = deadline - monotonic()
+            if slack > 0:
+                sleep(slack)
+            elif slack < -delay * size:
+                # do not catch up on the time lost in the slow read
+                deadline = monotonic()
+        if count == 0:
+            return np.nan, np.nan
+        return mean, np.sqrt(m2 / count)
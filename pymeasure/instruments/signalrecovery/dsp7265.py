@@ -29,7 +29,8 @@ log.addHandler(logging.NullHandler())
 from pymeasure.instruments import Instrument
 from pymeasure.instruments.validators import truncated_discrete_set, truncated_range, modular_range, modular_range_bidirectional, strict_discrete_set
 
-from time import sleep
+from time import sleep, monotonic
+import warnings
 import numpy as np
 
 
@@ -183,6 +184,13 @@ class DSP7265(Instrument):
             'ADC2': 64,
             'ADC3': 128
         }
+        # Length and sampling interval of the buffer, once set by set_buffer
+        self.points = None
+        self.interval = None
+        # Times by which a started buffer acquisition and ADC3 integration
+        # are expected to finish
+        self._buffer_done = None
+        self._adc3_done = None
 
         # Pre-condition
         self.adapter.config(datatype = 'str', converter = 's')
@@ -210,20 +218,26 @@ class DSP7265(Instrument):
 
     @property
     def adc3(self):
+        # Wait for an integration started by setting adc3_time to complete
+        if self._adc3_done is not None:
+            sleep(max(0, self._adc3_done - monotonic()))
+            self._adc3_done = None
         # 50,000 for 1V signal over 1 s
-        integral = self.values("ADC 3")
+        integral = self.values("ADC 3")[0]
         return float(integral)/(50000.0*self.adc3_time)
 
     @property
     def adc3_time(self):
         # Returns time in seconds
-        return self.values("ADC3TIME")/1000.0
+        return self.values("ADC3TIME")[0]/1000.0
 
     @adc3_time.setter
     def adc3_time(self, value):
         # Takes time in seconds
         self.write("ADC3TIME %g" % int(1000*value))
-        sleep(value*1.2)
+        # Rather than blocking here, adc3 waits until the new integration
+        # time has passed, with the same 20% margin
+        self._adc3_done = monotonic() + value*1.2
 
     @property
     def auto_gain(self):
@@ -251,43 +265,98 @@ class DSP7265(Instrument):
         self.write("ACGAIN %d" % int(value/10.0))
 
     def set_buffer(self, points, quantities=['x'], interval=10.0e-3):
-        num = 0
-        for q in quantities:
-            num += self.curve_bits[q]
+        num = sum(self.curve_bits[q] for q in quantities)
         self.points = points
-        self.write("CBD %d" % int(num))
-        self.write("LEN %d" % int(points))
         # interval in increments of 5ms
         interval = int(float(interval)/5.0e-3)
-        self.write("STR %d" % interval)
-        self.write("NC")
+        self.interval = interval*5.0e-3
+        # Send the whole configuration as one compound command
+        self.write("CBD %d;LEN %d;STR %d;NC" % (num, points, interval))
 
     def start_buffer(self):
         self.write("TD")
+        if self.points is not None and self.interval is not None:
+            self._buffer_done = monotonic() + self.points*self.interval
+        else:
+            # The buffer was not configured by set_buffer on this object
+            self._buffer_done = None
 
     def get_buffer(self, quantity='x', timeout=1.00, average=False):
-        count = 0
-        maxCount = int(timeout/0.05)
+        """ Waits for the acquisition to finish and returns the buffered
+        curve of a quantity as a numpy array in physical units. The whole
+        curve is transferred in a single binary dump (DCB), rather than
+        being queried point by point.
+
+        When a list of quantities is given, all their curves are dumped
+        together and a 2D array is returned, with one column per quantity
+        in the order given.
+
+        :param quantity: A key of :attr:`curve_bits` naming the curve to read,
+                         or a list of such keys
+        :param timeout: Time in seconds to wait for the acquisition, beyond
+                        its expected duration when started by :meth:`start_buffer`
+        :param average: Deprecated, call ``mean()`` on the returned array instead
+        :returns: A numpy array of the curve, or ``[0.0]`` if the acquisition
+                  did not finish within the timeout
+        """
+        if average:
+            warnings.warn("The average argument of get_buffer() is deprecated, "
+                          "call mean() on the returned array instead", FutureWarning)
+        if self._buffer_done is not None:
+            # Sleep through the expected acquisition time before polling
+            sleep(max(0, self._buffer_done - monotonic()))
+        deadline = monotonic() + timeout
+        delay = 0.001
         failed = False
-        while int(self.values("M")) != 0:
-            # Sleeping
-            sleep(0.05)
-            if count > maxCount:
-                # Count reached max value, wait longer before asking!
+        while int(self.values("M")[0]) != 0:
+            if monotonic() > deadline:
+                # Timeout reached, wait longer before asking!
                 failed = True
                 break
+            # Back off exponentially, up to 50 ms between polls
+            sleep(delay)
+            delay = min(2*delay, 0.05)
         if not failed:
-            data = []
-            # Getting data
-            for i in range(self.length):
-                val = self.values("DC. %d" % self.curve_bits[quantity])
-                data.append(val)
+            if isinstance(quantity, str):
+                data = self._dump_curves([quantity])[:, 0]
+            else:
+                data = self._dump_curves(quantity)
             if average:
-                return np.mean(data)
+                return data.mean(axis=0)
             else:
                 return data
         else:
-            return [0.0]
+            return np.array([0.0])
+
+    def _dump_curves(self, quantities):
+        """ Transfers the curves of the quantities in a single binary dump
+        and returns them in physical units as the columns of a 2D array.
+        """
+        # The instrument sends the curves in the order of their bits
+        ordered = sorted(quantities, key=self.curve_bits.get)
+        bits = sum(self.curve_bits[q] for q in ordered)
+        # Curves are sent as 16-bit integers, most significant byte first
+        data = self.binary_values("DCB %d" % bits, dtype='>i2')
+        points = self.points
+        if points is None:
+            points = int(self.values("LEN")[0])
+        data = data[:points * len(ordered)].reshape(-1, len(ordered))
+        columns = [ordered.index(q) for q in quantities]
+        scales = np.array([self._curve_scale(q) for q in quantities])
+        return data[:, columns] * scales
+
+    def _curve_scale(self, quantity):
+        """ Returns the factor converting the integer curve values of a
+        quantity into Volts (x, y, mag and ADCs) or degrees (phase)."""
+        if quantity in ('x', 'y', 'mag'):
+            # Integer values are scaled to 10000 at full sensitivity
+            return self.sensitivity / 10000.0
+        elif quantity == 'phase':
+            # Integer values are in centidegrees
+            return 0.01
+        else:
+            # Integer values are in millivolts
+            return 0.001
 
     def shutdown(self):
         log.info("Shutting down %s." % self.name)
@@ -22,6 +22,7 @@
 # THE SOFTWARE.
 #
 
+from bisect import bisect_left
 from decimal import Decimal
 
 
@@ -129,14 +130,10 @@ def truncated_discrete_set(value, values):
     :param value: A value to test
     :param values: A set of values that are valid
     """
-    # Force the values to be sorted
-    values = list(values)
-    values.sort()
-    for v in values:
-        if value <= v:
-            return v
-
-    return values[-1]
+    # Sort a copy of the values and bisect, rather than scanning linearly
+    values = sorted(values)
+    index = bisect_left(values, value)
+    return values[min(index, len(values) - 1)]
 
 
 def joined_validators(*validators):
@@ -163,8 +160,9 @@ def discreteTruncate(number, discreteSet):
     """
     if number < 0:
         return False
-    discreteSet.sort()
-    for item in discreteSet:
-        if number <= item:
-            return item
-    return False
+    # Sort a copy, so that the caller's list is not modified
+    discreteSet = sorted(discreteSet)
+    index = bisect_left(discreteSet, number)
+    if index == len(discreteSet):
+        return False
+    return discreteSet[index]
@@ -56,6 +56,11 @@ class Yokogawa7651(Instrument):
 
     """
 
+    @staticmethod
+    def _lines(v):
+        """ Returns the non-empty lines of a multi-line output string. """
+        return [line for line in v.splitlines() if line]
+
     @staticmethod
     def _find(v, key):
         """ Returns a value by parsing a current panel setting output
@@ -63,7 +68,9 @@ class Yokogawa7651(Instrument):
         is used for Instrument.control methods, and should not be
         called directly by the user.
         """
-        status = ''.join(v.split("\r\n\n")[1:-1])
+        # The first line identifies the instrument, and the last one ends
+        # the output
+        status = ''.join(Yokogawa7651._lines(v)[1:-1])
         keys = re.findall(r'[^\dE+.-]+', status)
         values = re.findall(r'[\dE+.-]+', status)
         if key not in keys:
@@ -140,7 +147,7 @@ class Yokogawa7651(Instrument):
     @property
     def id(self):
         """ Returns the identification of the instrument """
-        return self.ask("OS;E").split('\r\n\n')[0]
+        return self._lines(self.ask("OS;E"))[0]
 
     @property
     def source_enabled(self):
@@ -57,6 +57,14 @@ class StoppableThread(Thread):
     def should_stop(self):
         return self._should_stop.is_set()
 
+    def wait_for_stop(self, timeout=None):
+        """ Blocks until the thread is asked to stop, or the timeout passes
+
+        :param timeout: Timeout duration in seconds, or None to wait without limit
+        :returns: True if the thread should stop, False after a timeout
+        """
+        return self._should_stop.wait(timeout)
+
     def __repr__(self):
         return "<%s(should_stop=%s)>" % (
             self.__class__.__name__, self.should_stop())
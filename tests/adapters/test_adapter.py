@@ -37,6 +37,8 @@ def test_adapter_values():
     assert a.values("X,Y,Z") == ['X', 'Y', 'Z']
     assert a.values("X,Y,Z", cast=str) == ['X', 'Y', 'Z']
     assert a.values("X.Y.Z", separator='.') == ['X', 'Y', 'Z']
+    assert a.values("5,X,7") == [5, 'X', 7]
+    assert a.values("1,0", cast=bool) == [True, False]
 
 
 def test_adapter_preprocess_reply():
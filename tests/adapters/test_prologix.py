@@ -0,0 +1,38 @@
+#
+# This file is part of the PyMeasure package.
+#
+# Copyright (c) 2013-2020 PyMeasure Developers
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN
+# THE SOFTWARE.
+#
+
+from pymeasure.adapters import PrologixAdapter
+
+
+def test_prologix_write(fake_serial):
+    connection = fake_serial()
+    PrologixAdapter(connection, address=5).write("*RST")
+    assert connection.written == b'++addr 5\n*RST\n'
+
+
+def test_prologix_read_multiple_lines(fake_serial):
+    connection = fake_serial([b'first\r\nsecond\r\nEND\r\n'], trigger=b'++read eoi\n')
+    adapter = PrologixAdapter(connection, address=5)
+    assert adapter.ask("OS") == 'first\r\nsecond\r\nEND\r\n'
+    assert connection.written == b'++addr 5\nOS\n++addr 5\n++read eoi\n'
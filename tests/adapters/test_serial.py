@@ -0,0 +1,41 @@
+#
+# This file is part of the PyMeasure package.
+#
+# Copyright (c) 2013-2020 PyMeasure Developers
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN
+# THE SOFTWARE.
+#
+
+from pymeasure.adapters import SerialAdapter
+
+
+def test_read_until_timeout(fake_serial):
+    connection = fake_serial([b'first\r\nsecond\r\n'])
+    adapter = SerialAdapter(connection)
+    assert adapter.ask("LIST?") == 'first\r\nsecond\r\n'
+    assert connection.written == b'LIST?'
+    assert connection.timeouts == 1
+
+
+def test_read_termination(fake_serial):
+    connection = fake_serial([b'1.5\r\n', b'2.5\r\n'])
+    adapter = SerialAdapter(connection, read_termination='\r\n')
+    assert adapter.ask("VAL?") == '1.5\r\n'
+    assert adapter.ask("VAL?") == '2.5\r\n'
+    assert connection.timeouts == 0
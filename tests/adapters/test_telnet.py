@@ -0,0 +1,56 @@
+#
+# This file is part of the PyMeasure package.
+#
+# Copyright (c) 2013-2020 PyMeasure Developers
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN
+# THE SOFTWARE.
+#
+
+import socket
+
+import pytest
+
+from pymeasure.adapters import TelnetAdapter
+
+
+@pytest.fixture
+def connection():
+    server = socket.socket()
+    server.bind(('127.0.0.1', 0))
+    server.listen(1)
+    adapter = TelnetAdapter('127.0.0.1', server.getsockname()[1])
+    instrument, _ = server.accept()
+    yield adapter, instrument
+    instrument.close()
+    server.close()
+
+
+def test_telnet_read(connection):
+    adapter, instrument = connection
+    assert adapter.connection.sock.getsockopt(
+        socket.IPPROTO_TCP, socket.TCP_NODELAY)
+    instrument.sendall(b'voltage = 1.5 V\r\nOK\r\n')
+    assert adapter.connection.read_until(b'OK\r\n') == b'voltage = 1.5 V\r\nOK\r\n'
+
+
+def test_telnet_read_with_commands(connection):
+    adapter, instrument = connection
+    # NOP command and escaped IAC byte are removed by telnetlib
+    instrument.sendall(b'a\xff\xf1b\xff\xffc\r\n')
+    assert adapter.connection.read_until(b'\r\n') == b'ab\xffc\r\n'
@@ -23,3 +23,40 @@
 #
 
 import pytest
+import serial
+
+
+class FakeSerial(serial.Serial):
+    """ Serial connection, which records the written bytes and returns the
+    next queued response after each write ending with the trigger """
+
+    def __init__(self, responses=(), trigger=b''):
+        self.responses = list(responses)
+        self.trigger = trigger
+        self.written = b''
+        self.buffer = b''
+        self.timeouts = 0
+
+    @property
+    def in_waiting(self):
+        return len(self.buffer)
+
+    def write(self, data):
+        self.written += data
+        if data.endswith(self.trigger) and self.responses:
+            self.buffer += self.responses.pop(0)
+
+    def read(self, size=1):
+        data, self.buffer = self.buffer[:size], self.buffer[size:]
+        if not data:
+            self.timeouts += 1  # a real connection would wait for the timeout
+        return data
+
+    def close(self):
+        pass
+
+
+@pytest.fixture
+def fake_serial():
+    """ Returns the :class:`FakeSerial` class to construct connections """
+    return FakeSerial
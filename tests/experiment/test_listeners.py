@@ -22,9 +22,13 @@
 # THE SOFTWARE.
 #
 
+import os
 import time
 from queue import Queue
 
+import pytest
+
+from pymeasure.experiment import Procedure
 from pymeasure.experiment.listeners import Listener, Recorder
 from pymeasure.experiment.results import Results
 
@@ -38,3 +42,53 @@ def test_recorder_stop():
     r = Recorder(d, q)
     r.
 """
+
+
+def test_listener_receive_all():
+    zmq = pytest.importorskip('zmq')
+    cloudpickle = pytest.importorskip('cloudpickle')
+    context = zmq.Context()
+    publisher = context.socket(zmq.PUB)
+    port = publisher.bind_to_random_port('tcp://*')
+    listener = Listener(port, timeout=1)
+    time.sleep(0.2)  # Allow the subscription to propagate
+    for i in range(3):
+        publisher.send_multipart((b'progress', cloudpickle.dumps(i)))
+    time.sleep(0.1)
+    assert listener.receive_all() == [('progress', 0), ('progress', 1), ('progress', 2)]
+    listener.timeout = 0.01
+    assert listener.receive_all() == []
+    publisher.close(linger=0)
+    listener.subscriber.close(linger=0)
+
+
+def test_listener_inproc():
+    zmq = pytest.importorskip('zmq')
+    cloudpickle = pytest.importorskip('cloudpickle')
+    from pymeasure.experiment.listeners import INPROC_ADDRESS
+    # An XPUB socket receives the subscription of the listener
+    publisher = zmq.Context.instance().socket(zmq.XPUB)
+    # The inproc endpoint is named after the TCP port of the Worker
+    port = publisher.bind_to_random_port('tcp://127.0.0.1')
+    publisher.bind(INPROC_ADDRESS % port)
+    listener = Listener(port, timeout=1, inproc=True)
+    assert publisher.poll(1000), "The listener did not subscribe"
+    assert publisher.recv() == b'\x01'  # subscription to all topics
+    publisher.send_multipart((b'status', cloudpickle.dumps(4)))
+    assert listener.receive_all() == [('status', 4)]
+    publisher.close(linger=0)
+    listener.subscriber.close(linger=0)
+
+
+def test_recorder_handle_rows(tmpdir):
+    class DummyProcedure(Procedure):
+        DATA_COLUMNS = ['Foo', 'Bar']
+    filename = os.path.join(str(tmpdir), 'recorder_test.csv')
+    results = Results(DummyProcedure(), filename)
+    recorder = Recorder(results, Queue())
+    recorder.start()
+    recorder.handle({'Foo': 1, 'Bar': 2})
+    recorder.handle([{'Foo': 3, 'Bar': 4}, {'Foo': 5, 'Bar': 6}])
+    recorder.handle([])
+    recorder.stop()
+    assert results.data['Foo'].tolist() == [1, 3, 5]
@@ -44,6 +44,20 @@ def test_parameters():
     assert 'x' in objs
     assert objs['x'].value == p.x
 
+
+def test_inherited_parameters():
+    class TestProcedure(Procedure):
+        x = Parameter('X', default=5)
+
+    class ChildProcedure(TestProcedure):
+        y = Parameter('Y', default=1)
+
+    assert TestProcedure().parameter_values() == {'x': 5}
+    first, second = ChildProcedure(), ChildProcedure()
+    first.y = 2
+    assert first.parameter_values() == {'x': 5, 'y': 2}
+    assert second.parameter_values() == {'x': 5, 'y': 1}
+
 # TODO: Add tests for measureables
 
 def test_procedure_wrapper():
@@ -56,3 +70,15 @@ def test_procedure_wrapper():
     assert hasattr(new_wrapper, 'procedure')
     assert new_wrapper.procedure.iterations == 101
     assert RandomProcedure.iterations.value == 100
+
+
+def test_set_parameters():
+    class TestProcedure(Procedure):
+        x = Parameter('X', default=5)
+
+    p = TestProcedure()
+    with pytest.raises(NameError):
+        p.set_parameters({'x': 1, 'y': 2})
+    assert p.x == 5  # Nothing is set when a parameter is unknown
+    p.set_parameters({'x': 1, 'y': 2}, except_missing=False)
+    assert p.x == 1
@@ -113,3 +113,18 @@ class TestResults:
         result.reload() # assert no error
         pd.read_csv(filename, comment="#") # assert no error
         assert (result.parameters['par'].value == np.linspace(1,100,17)).all()
+
+    def test_data_is_read_only_when_file_grows(self, tmpdir):
+        class DummyProcedure(Procedure):
+            DATA_COLUMNS = ['Foo', 'Bar']
+        filename = os.path.join(str(tmpdir), 'appended_data_test.csv')
+        result = Results(DummyProcedure(), filename)
+        with open(filename, 'a') as f:
+            f.write('1,2\n')
+        assert len(result.data) == 1
+        with mock.patch('pymeasure.experiment.results.pd.read_csv') as read_csv_mock:
+            assert len(result.data) == 1
+            read_csv_mock.assert_not_called()
+        with open(filename, 'a') as f:
+            f.write('3,4\n')
+        assert result.data['Foo'].tolist() == [1, 3]
@@ -25,7 +25,7 @@
 import pytest
 import os
 import tempfile
-from time import sleep
+from time import sleep, monotonic
 from importlib.machinery import SourceFileLoader
 
 from pymeasure.experiment.workers import Worker
@@ -82,3 +82,77 @@ def test_worker_closes_file_after_finishing():
 
     # Test if the file has been properly closed by removing the file
     os.remove(file)
+
+
+@pytest.mark.parametrize("out_of_band", [True, False])
+def test_worker_emit_array(monkeypatch, out_of_band):
+    zmq = pytest.importorskip('zmq')
+    np = pytest.importorskip('numpy')
+    from pymeasure.experiment import workers
+    from pymeasure.experiment.listeners import Listener
+    if out_of_band and not workers.OUT_OF_BAND_PICKLE:
+        pytest.skip("cloudpickle can not pickle out-of-band")
+    monkeypatch.setattr(workers, 'OUT_OF_BAND_PICKLE', out_of_band)
+    results = Results(RandomProcedure(), tempfile.mktemp())
+    worker = Worker(results)
+    worker.publisher = zmq.Context.instance().socket(zmq.PUB)
+    port = worker.publisher.bind_to_random_port('tcp://*')
+    listener = Listener(port, timeout=1)
+    sleep(0.2)  # Allow the subscription to propagate
+    trace = np.arange(100000.)
+    worker.emit('trace', {'trace': trace})
+    topic, record = listener.receive_all()[0]
+    assert topic == 'trace'
+    assert np.array_equal(record['trace'], trace)
+    worker.publisher.close(linger=0)
+    listener.subscriber.close(linger=0)
+
+
+def test_out_of_band_pickle_needs_buffer_callback(monkeypatch):
+    from pymeasure.experiment import workers
+
+    class OldCloudpickle:
+        @staticmethod
+        def dumps(obj, protocol=None):
+            return b''
+
+    monkeypatch.setattr(workers, 'cloudpickle', OldCloudpickle)
+    assert not workers._out_of_band_pickle()
+
+
+def test_worker_waits_for_subscription():
+    zmq = pytest.importorskip('zmq')
+    from pymeasure.experiment.listeners import Listener
+    procedure = RandomProcedure()
+    procedure.iterations = 5
+    procedure.delay = 0.001
+    results = Results(procedure, tempfile.mktemp())
+    socket = zmq.Context.instance().socket(zmq.PUB)
+    port = socket.bind_to_random_port('tcp://*')
+    socket.close(linger=0)
+    listener = Listener(port, topic='status', timeout=1)
+    worker = Worker(results, port=port, wait_for_subscriber=True)
+    worker.start()
+    worker.join(timeout=5)
+    # The first status is only received if the worker waited for the listener
+    assert listener.receive_all()[0] == ('status', RandomProcedure.RUNNING)
+    listener.subscriber.close(linger=0)
+    assert worker.publisher.closed
+
+
+def test_worker_does_not_wait_without_subscriber():
+    zmq = pytest.importorskip('zmq')
+    procedure = RandomProcedure()
+    procedure.iterations = 1
+    procedure.delay = 0
+    results = Results(procedure, tempfile.mktemp())
+    socket = zmq.Context.instance().socket(zmq.PUB)
+    port = socket.bind_to_random_port('tcp://*')
+    socket.close(linger=0)
+    worker = Worker(results, port=port)
+    worker.subscribe_timeout = 5
+    start = monotonic()
+    worker.start()
+    worker.join(timeout=5)
+    assert monotonic() - start < 1
+    assert worker.publisher.closed
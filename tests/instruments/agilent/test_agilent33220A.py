@@ -0,0 +1,68 @@
+#
+# This file is part of the PyMeasure package.
+#
+# Copyright (c) 2013-2020 PyMeasure Developers
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN
+# THE SOFTWARE.
+#
+
+import pytest
+
+from pymeasure.adapters import FakeAdapter
+from pymeasure.instruments.agilent.agilent33220A import Agilent33220A
+
+
+class ErrorQueueAdapter(FakeAdapter):
+    """ Returns the errors of a queue for the chained error queries """
+
+    def __init__(self, errors):
+        super().__init__()
+        self.errors = list(errors)
+        self.commands = []
+
+    def ask(self, command):
+        self.commands.append(command)
+        replies = []
+        for _ in command.split(";"):
+            replies.append(self.errors.pop(0) if self.errors else '+0,"No error"')
+        return ";".join(replies)
+
+
+def test_check_errors_query():
+    adapter = ErrorQueueAdapter([])
+    assert Agilent33220A(adapter).check_errors() == []
+    assert adapter.commands == [";".join([":SYST:ERR?"] * 5)]
+
+
+def test_check_errors_reads_whole_queue():
+    errors = ['-%d,"Error %d"' % (100 + i, i) for i in range(7)]
+    adapter = ErrorQueueAdapter(errors)
+    assert Agilent33220A(adapter).check_errors() == [
+        'Agilent 33220A: -%d: "Error %d"' % (100 + i, i) for i in range(7)
+    ]
+    assert len(adapter.commands) == 2
+
+
+def test_string_settings():
+    adapter = ErrorQueueAdapter([])
+    generator = Agilent33220A(adapter)
+    generator.shape = "square"
+    assert adapter.read() == "FUNC SQUARE"
+    with pytest.raises(ValueError, match=r"\['DC', 'NOIS'"):
+        generator.shape = "triangle"
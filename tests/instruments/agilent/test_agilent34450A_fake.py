@@ -0,0 +1,123 @@
+#
+# This file is part of the PyMeasure package.
+#
+# Copyright (c) 2013-2020 PyMeasure Developers
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN
+# THE SOFTWARE.
+#
+
+from types import SimpleNamespace
+
+import pytest
+
+from pymeasure.adapters import FakeAdapter
+from pymeasure.instruments.agilent.agilent34450A import Agilent34450A
+
+NO_ERROR = '+0,"No error"'
+
+
+class DMMAdapter(FakeAdapter):
+    """ Records the written and queried commands in order, and answers the
+    error queue and configuration queries """
+
+    def __init__(self, configuration='"VOLT +1.000000E+01,+1.500000E-06"'):
+        super().__init__()
+        self.connection = SimpleNamespace(timeout=None)
+        self.configuration = configuration
+        self.commands = []
+
+    def write(self, command):
+        self.commands.append(command)
+
+    def ask(self, command):
+        self.commands.append(command)
+        if command.startswith(":SYST:ERR?"):
+            return ";".join([NO_ERROR] * command.count("?"))
+        if command == ":configure?":
+            return self.configuration
+        return "1"
+
+
+@pytest.fixture
+def adapter():
+    return DMMAdapter()
+
+
+@pytest.fixture
+def dmm(adapter):
+    dmm = Agilent34450A(adapter)
+    adapter.commands.clear()
+    return dmm
+
+
+def test_check_errors_query(adapter):
+    Agilent34450A(adapter)
+    assert adapter.commands == [";".join([":SYST:ERR?"] * 5)]
+
+
+def test_configure_is_chained(dmm, adapter):
+    dmm.configure_voltage(voltage_range=10, resolution="MIN")
+    assert adapter.commands == [
+        ":configure:VOLT;:SENS:VOLT:RES MIN;"
+        ":SENS:VOLT:RANG:AUTO 0;:SENS:VOLT:RANG 10"
+    ]
+
+
+def test_configure_skips_redundant_mode(dmm, adapter):
+    dmm.configure_voltage()
+    dmm.configure_voltage()
+    assert adapter.commands == [
+        ":configure:VOLT;:SENS:VOLT:RES DEF;:SENS:VOLT:RANG:AUTO 1",
+        ":SENS:VOLT:RES DEF;:SENS:VOLT:RANG:AUTO 1",
+    ]
+
+
+def test_configure_sets_mode_again_after_reset(dmm, adapter):
+    dmm.configure_temperature()
+    dmm.reset()
+    dmm.configure_temperature()
+    assert adapter.commands == [":configure:TEMP", "*RST", ":configure:TEMP"]
+
+
+def test_batch_writes_flush_before_query(dmm, adapter):
+    with dmm.batch_writes():
+        dmm.voltage_auto_range = True
+        dmm.voltage_resolution = "MAX"
+        assert adapter.commands == []
+        assert dmm.voltage == 1
+        dmm.beep()
+    assert adapter.commands == [
+        ":SENS:VOLT:RANG:AUTO 1;:SENS:VOLT:RES MAX", ":READ?", ":SYST:BEEP"
+    ]
+
+
+def test_discrete_control_rejects_other_values(dmm, adapter):
+    with pytest.raises(ValueError):
+        dmm.voltage_range = 5
+    with pytest.raises(ValueError):
+        dmm.voltage_range = [10]
+    assert adapter.commands == []
+
+
+def test_parse_configuration(dmm, adapter):
+    assert dmm._conf_parser(adapter.configuration) == ("VOLT", 10.0, 1.5e-06)
+    assert dmm._conf_parser(['"CURR +1.000000E-01', '+1.500000E-06"']) == (
+        "CURR", 0.1, 1.5e-06)
+    assert dmm._conf_parser('"CAP +1.000000E-06,DEF"') == ("CAP", 1e-06, "DEF")
+    assert dmm.mode == "voltage"
@@ -0,0 +1,74 @@
+#
+# This file is part of the PyMeasure package.
+#
+# Copyright (c) 2013-2020 PyMeasure Developers
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN
+# THE SOFTWARE.
+#
+
+import pytest
+
+import pymeasure.adapters.telnet
+
+
+class FakeTelnet:
+    """ Telnet connection to a fake Attocube console, which answers each
+    command line with the reply in ``replies``, or not at all """
+
+    replies = {
+        b'secret': b'Authorization success\r\n',
+        b'echo off': b'echo off\r\nOK\r\n',
+        b'getv 1': b'voltage = 20.000000 V\r\nOK\r\n',
+    }
+
+    def __init__(self, host, port, **kwargs):
+        self.host, self.port = host, port
+        self.sock = self
+        self.buffer = b'Welcome\r\n'
+        self.timeouts = []
+
+    def setsockopt(self, *args):
+        pass
+
+    def close(self):
+        pass
+
+    def write(self, data):
+        for line in data.split(b'\r\n')[:-1]:
+            self.buffer += self.replies.get(line, b'')
+
+    def read_some(self):
+        data, self.buffer = self.buffer, b''
+        return data
+
+    read_very_eager = read_some
+
+    def read_until(self, expected, timeout=None):
+        # a real connection would wait up to timeout for the missing data
+        self.timeouts.append(timeout)
+        index = self.buffer.find(expected)
+        end = len(self.buffer) if index < 0 else index + len(expected)
+        data, self.buffer = self.buffer[:end], self.buffer[end:]
+        return data
+
+
+@pytest.fixture
+def fake_telnet(monkeypatch):
+    """ Makes the TelnetAdapter connect to a :class:`FakeTelnet` console """
+    monkeypatch.setattr(pymeasure.adapters.telnet, '_Telnet', FakeTelnet)
@@ -0,0 +1,49 @@
+#
+# This file is part of the PyMeasure package.
+#
+# Copyright (c) 2013-2020 PyMeasure Developers
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN
+# THE SOFTWARE.
+#
+
+import pytest
+
+from pymeasure.instruments.attocube.adapters import AttocubeConsoleAdapter
+
+
+@pytest.fixture
+def adapter(fake_telnet):
+    return AttocubeConsoleAdapter('host', 7230, 'secret', reply_timeout=2)
+
+
+def test_ask(adapter):
+    adapter.connection.timeouts.clear()
+    assert adapter.ask('getv 1') == 'voltage = 20.000000 V'
+    assert all(0 < timeout <= 2 for timeout in adapter.connection.timeouts)
+
+
+def test_ask_timeout(adapter):
+    adapter.connection.replies = {b'getv 1': b'voltage = 20.000000 V\r\n'}
+    with pytest.raises(TimeoutError):
+        adapter.ask('getv 1')
+
+
+def test_authorization_timeout(fake_telnet):
+    with pytest.raises(TimeoutError):
+        AttocubeConsoleAdapter('host', 7230, 'wrong', reply_timeout=2)
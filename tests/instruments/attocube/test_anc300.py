@@ -0,0 +1,56 @@
+#
+# This file is part of the PyMeasure package.
+#
+# Copyright (c) 2013-2020 PyMeasure Developers
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN
+# THE SOFTWARE.
+#
+
+import pytest
+
+from pymeasure.instruments.attocube import ANC300Controller
+
+MOVE = {
+    b'getf 1': b'frequency = 100 Hz\r\nOK\r\n',
+    b'setm 1 stp': b'OK\r\n',
+    b'stepu 1 200': b'OK\r\n',
+    b'stepw 1': b'OK\r\n',
+    b'setm 1 gnd': b'OK\r\n',
+}
+
+
+@pytest.fixture
+def controller(fake_telnet):
+    return ANC300Controller('host', ['x'], 'secret', query_delay=0,
+                            reply_timeout=2)
+
+
+def test_move(controller):
+    controller.adapter.connection.replies = MOVE
+    controller.adapter.connection.timeouts.clear()
+    controller.x.move(200)
+    # the reads of the move may take as long as its 200 steps at 100 Hz
+    assert 2 < max(controller.adapter.connection.timeouts) <= 4
+
+
+def test_move_timeout(controller):
+    controller.adapter.connection.replies = dict(MOVE)
+    del controller.adapter.connection.replies[b'stepw 1']
+    with pytest.raises(TimeoutError):
+        controller.x.move(200, timeout=1)
@@ -0,0 +1,84 @@
+#
+# This file is part of the PyMeasure package.
+#
+# Copyright (c) 2013-2020 PyMeasure Developers
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN
+# THE SOFTWARE.
+#
+
+import itertools
+
+import numpy as np
+import pytest
+
+from pymeasure.adapters import FakeAdapter
+from pymeasure.instruments import Instrument
+from pymeasure.instruments.lakeshore.lakeshore425 import LakeShore425
+
+
+class FieldAdapter(FakeAdapter):
+    """ Answers field queries with increasing values, and optionally only
+    the first of chained queries """
+
+    def __init__(self, chained=True):
+        super().__init__()
+        self.chained = chained
+        self.commands = []
+        self.fields = itertools.count()
+
+    def ask(self, command):
+        self.commands.append(command)
+        queries = command.count("?") if self.chained else 1
+        return ";".join("%+.4E" % next(self.fields) for _ in range(queries))
+
+
+def lakeshore(adapter):
+    instrument = LakeShore425.__new__(LakeShore425)
+    Instrument.__init__(instrument, adapter, "LakeShore 425 Gaussmeter")
+    return instrument
+
+
+def test_measure():
+    adapter = FieldAdapter()
+    mean, std = lakeshore(adapter).measure(5, delay=0)
+    assert adapter.commands == ["RDGFIELD?"] * 5
+    assert mean == pytest.approx(2)
+    assert std == pytest.approx(np.std(range(5)))
+
+
+def test_measure_chained():
+    adapter = FieldAdapter()
+    mean, std = lakeshore(adapter).measure(10, delay=0, batch=4)
+    assert adapter.commands == [";".join(["RDGFIELD?"] * n) for n in (4, 4, 2)]
+    assert mean == pytest.approx(4.5)
+    assert std == pytest.approx(np.std(range(10)))
+
+
+def test_measure_chained_fallback():
+    adapter = FieldAdapter(chained=False)
+    instrument = lakeshore(adapter)
+    mean, std = instrument.measure(3, delay=0, batch=4)
+    # the reply to the chained query is discarded
+    assert adapter.commands == [";".join(["RDGFIELD?"] * 3)] + ["RDGFIELD?"] * 3
+    assert mean == pytest.approx(2)
+    assert std == pytest.approx(np.std(range(1, 4)))
+    assert not instrument.chained_queries
+    adapter.commands.clear()
+    instrument.measure(2, delay=0, batch=4)
+    assert adapter.commands == ["RDGFIELD?"] * 2
@@ -0,0 +1,70 @@
+#
+# This file is part of the PyMeasure package.
+#
+# Copyright (c) 2013-2020 PyMeasure Developers
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN
+# THE SOFTWARE.
+#
+
+import numpy as np
+
+from pymeasure.adapters import FakeAdapter
+from pymeasure.instruments.signalrecovery.dsp7265 import DSP7265
+
+
+class BufferAdapter(FakeAdapter):
+    """ Answers the queries of a finished buffer acquisition of 3 points,
+    which holds 4 points of memory """
+
+    def __init__(self):
+        super().__init__()
+        self.commands = []
+
+    def config(self, **kwargs):
+        pass
+
+    def write(self, command):
+        self.commands.append(command)
+
+    def ask(self, command):
+        self.commands.append(command)
+        return {"M": "0", "LEN": "3"}[command]
+
+    def binary_values(self, command, header_bytes=0, dtype=np.float32):
+        self.commands.append(command)
+        return np.array([1000, 2000, 3000, 0], dtype=dtype)
+
+
+def test_get_buffer_without_set_buffer():
+    adapter = BufferAdapter()
+    lockin = DSP7265(adapter)
+    lockin.start_buffer()
+    data = lockin.get_buffer('ADC1')
+    assert adapter.commands == ["TD", "M", "DCB 32", "LEN"]
+    np.testing.assert_allclose(data, [1, 2, 3])
+
+
+def test_get_buffer_after_set_buffer():
+    adapter = BufferAdapter()
+    lockin = DSP7265(adapter)
+    lockin.set_buffer(2, quantities=['ADC1'], interval=5e-3)
+    lockin.start_buffer()
+    data = lockin.get_buffer('ADC1')
+    assert adapter.commands == ["CBD 32;LEN 2;STR 1;NC", "TD", "M", "DCB 32"]
+    np.testing.assert_allclose(data, [1, 2])
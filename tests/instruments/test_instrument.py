@@ -221,3 +221,42 @@ def test_setting_process():
     assert fake.read() == 'OUT 0'
     fake.x = 2
     assert fake.read() == 'OUT 1'
+
+
+def test_control_check_set_errors():
+    class Fake(FakeInstrument):
+        errors = 0
+
+        x = Instrument.control(
+            "", "%d", "",
+            check_set_errors=True,
+        )
+        y = Instrument.control(
+            "", "%d", "",
+        )
+
+        def check_errors(self):
+            self.errors += 1
+
+    fake = Fake()
+    fake.x = 5
+    assert fake.read() == '5'
+    assert fake.errors == 1
+    fake.y = 5
+    assert fake.errors == 1
+
+
+def test_scpi_properties():
+    class Fake(Instrument):
+        def __init__(self):
+            super().__init__(FakeAdapter(), "Fake SCPI Instrument")
+
+        @property
+        def status(self):
+            return "Custom status"
+
+    instr = Fake()
+    assert instr.status == "Custom status"
+    assert instr.complete == "*OPC?"  # FakeAdapter echoes the command
+    fake = FakeInstrument()
+    assert fake.status == "Warning: Property not implemented."
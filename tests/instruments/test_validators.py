@@ -27,7 +27,7 @@ from pymeasure.instruments.validators import (
     strict_range, strict_discrete_range, strict_discrete_set,
     truncated_range, truncated_discrete_set,
     modular_range, modular_range_bidirectional,
-    joined_validators
+    joined_validators, discreteTruncate
 )
 
 
@@ -74,6 +74,16 @@ def test_truncated_discrete_set():
     assert truncated_discrete_set(-10, range(10)) == 0
 
 
+def test_discrete_truncate():
+    values = [10, 2, 5]
+    assert discreteTruncate(3, values) == 5
+    assert discreteTruncate(5, values) == 5
+    assert discreteTruncate(0, values) == 2
+    assert discreteTruncate(11, values) is False
+    assert discreteTruncate(-1, values) is False
+    assert values == [10, 2, 5]
+
+
 def test_modular_range():
     assert modular_range(5, range(10)) == 5
     assert abs(modular_range(5.1, range(10)) - 5.1) < 1e-6
@@ -0,0 +1,53 @@
+#
+# This file is part of the PyMeasure package.
+#
+# Copyright (c) 2013-2020 PyMeasure Developers
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN
+# THE SOFTWARE.
+#
+
+import pytest
+
+from pymeasure.adapters import PrologixAdapter
+from pymeasure.instruments.yokogawa.yokogawa7651 import Yokogawa7651
+
+
+PANEL_SETTINGS = b'MDL7651REV1.05\r\nF1R4S+1.0000E+0\r\nM0G0I0\r\nLV30LA120\r\nEND\r\n'
+
+
+@pytest.mark.parametrize("output", [
+    PANEL_SETTINGS.decode(),
+    # lines joined with an additional line feed, as by earlier adapters
+    PANEL_SETTINGS.decode().replace('\r\n', '\r\n\n'),
+])
+def test_find(output):
+    assert Yokogawa7651._find(output, 'F') == '1'
+    assert Yokogawa7651._find(output, 'R') == '4'
+    assert Yokogawa7651._find(output, 'LA') == '120'
+    with pytest.raises(ValueError):
+        Yokogawa7651._find(output, 'X')
+
+
+def test_panel_settings_over_prologix(fake_serial):
+    connection = fake_serial([PANEL_SETTINGS] * 4, trigger=b'++read eoi\n')
+    yoko = Yokogawa7651(PrologixAdapter(connection, address=1))
+    assert yoko.id == 'MDL7651REV1.05'
+    assert yoko.source_mode == 'voltage'
+    assert yoko.source_voltage_range == 1
+    assert yoko.compliance_current == pytest.approx(0.12)
@@ -37,3 +37,9 @@ def test_thread_joining():
     t.start()
     t.join()
     assert t.should_stop() is True
+
+def test_thread_wait_for_stop():
+    t = StoppableThread()
+    assert t.wait_for_stop(0.01) is False
+    t.stop()
+    assert t.wait_for_stop(10) is True